@@ -10,9 +10,35 @@ Usage:
 
 import argparse
 import sys
+from functools import lru_cache
 
 
-def main():
+class Choices(frozenset):
+    """Frozenset of choices that iterates in declaration order for help output."""
+
+    __slots__ = ('_order',)
+
+    def __new__(cls, *values):
+        self = super().__new__(cls, values)
+        self._order = tuple(dict.fromkeys(values))
+        return self
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __reduce__(self):
+        # frozenset's own __reduce__ passes one iterable, not *values
+        return (type(self), self._order)
+
+
+LOG_LEVELS = Choices('debug', 'info', 'warning', 'error', 'critical')
+LOG_FORMATS = Choices('text', 'json')
+CACHE_BACKENDS = Choices('redis', 'memcached', 'memory')
+
+
+@lru_cache(maxsize=None)
+def build_parser():
+    """Build the argument parser once; later calls reuse it."""
     parser = argparse.ArgumentParser(
         description='Organized arguments with groups',
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -110,7 +136,7 @@ def main():
 
     log_group.add_argument(
         '--log-level',
-        choices=['debug', 'info', 'warning', 'error', 'critical'],
+        choices=LOG_LEVELS,
         default='info',
         help='Logging level (default: %(default)s)'
     )
@@ -122,7 +148,7 @@ def main():
 
     log_group.add_argument(
         '--log-format',
-        choices=['text', 'json'],
+        choices=LOG_FORMATS,
         default='text',
         help='Log format (default: %(default)s)'
     )
@@ -141,7 +167,7 @@ def main():
 
     cache_group.add_argument(
         '--cache-backend',
-        choices=['redis', 'memcached', 'memory'],
+        choices=CACHE_BACKENDS,
         default='memory',
         help='Cache backend (default: %(default)s)'
     )
@@ -196,6 +222,12 @@ def main():
         help='Rate limit (requests per minute, default: %(default)s)'
     )
 
+    return parser
+
+
+def main():
+    parser = build_parser()
+
     # Parse arguments
     args = parser.parse_args()
 
@@ -203,38 +235,38 @@ def main():
     if args.ssl and (not args.cert or not args.key):
         parser.error("--cert and --key are required when --ssl is enabled")
 
-    # Display configuration
-    print("Configuration Summary:")
-
-    print("\nServer:")
-    print(f"  Host: {args.host}:{args.port}")
-    print(f"  Workers: {args.workers}")
-    print(f"  SSL: {'Enabled' if args.ssl else 'Disabled'}")
-    if args.ssl:
-        print(f"  Certificate: {args.cert}")
-        print(f"  Key: {args.key}")
-
-    print("\nDatabase:")
-    print(f"  Host: {args.db_host}:{args.db_port}")
-    print(f"  Database: {args.db_name}")
-    print(f"  User: {args.db_user or '(not set)'}")
-    print(f"  Pool Size: {args.db_pool_size}")
-
-    print("\nLogging:")
-    print(f"  Level: {args.log_level}")
-    print(f"  File: {args.log_file or 'stdout'}")
-    print(f"  Format: {args.log_format}")
-    print(f"  Access Log: {'Enabled' if args.access_log else 'Disabled'}")
-
-    print("\nCache:")
-    print(f"  Backend: {args.cache_backend}")
-    print(f"  Host: {args.cache_host}:{args.cache_port}")
-    print(f"  TTL: {args.cache_ttl}s")
-
-    print("\nSecurity:")
-    print(f"  Auth Required: {'Yes' if args.auth_required else 'No'}")
-    print(f"  CORS Origins: {args.cors_origins or '(not set)'}")
-    print(f"  Rate Limit: {args.rate_limit} req/min")
+    # Display configuration, collected and written in a single call
+    ssl_details = (
+        f"  Certificate: {args.cert}\n"
+        f"  Key: {args.key}\n"
+    ) if args.ssl else ""
+
+    sys.stdout.write(
+        "Configuration Summary:\n"
+        "\nServer:\n"
+        f"  Host: {args.host}:{args.port}\n"
+        f"  Workers: {args.workers}\n"
+        f"  SSL: {'Enabled' if args.ssl else 'Disabled'}\n"
+        f"{ssl_details}"
+        "\nDatabase:\n"
+        f"  Host: {args.db_host}:{args.db_port}\n"
+        f"  Database: {args.db_name}\n"
+        f"  User: {args.db_user or '(not set)'}\n"
+        f"  Pool Size: {args.db_pool_size}\n"
+        "\nLogging:\n"
+        f"  Level: {args.log_level}\n"
+        f"  File: {args.log_file or 'stdout'}\n"
+        f"  Format: {args.log_format}\n"
+        f"  Access Log: {'Enabled' if args.access_log else 'Disabled'}\n"
+        "\nCache:\n"
+        f"  Backend: {args.cache_backend}\n"
+        f"  Host: {args.cache_host}:{args.cache_port}\n"
+        f"  TTL: {args.cache_ttl}s\n"
+        "\nSecurity:\n"
+        f"  Auth Required: {'Yes' if args.auth_required else 'No'}\n"
+        f"  CORS Origins: {args.cors_origins or '(not set)'}\n"
+        f"  Rate Limit: {args.rate_limit} req/min\n"
+    )
 
     return 0
 
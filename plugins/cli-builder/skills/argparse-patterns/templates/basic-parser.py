@@ -8,11 +8,18 @@ Usage:
     python basic-parser.py deploy app2 --env staging --timeout 60
 """
 
-import argparse
+import os
 import sys
+from functools import lru_cache
 
+VERSION = '1.0.0'
+
+
+@lru_cache(maxsize=None)
+def build_parser():
+    """Build the argument parser once; later calls reuse it."""
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(
         description='Deploy application to specified environment',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -28,7 +35,7 @@ Examples:
     parser.add_argument(
         '--version',
         action='version',
-        version='%(prog)s 1.0.0'
+        version=f'%(prog)s {VERSION}'
     )
 
     # Required positional argument
@@ -71,6 +78,18 @@ Examples:
         help='Increase verbosity (-v, -vv, -vvv)'
     )
 
+    return parser
+
+
+def main():
+    # A bare --version is answered before argparse is imported or the parser
+    # is built; everything else, --help included, goes through argparse
+    if sys.argv[1:] == ['--version']:
+        sys.stdout.write(f"{os.path.basename(sys.argv[0])} {VERSION}\n")
+        return 0
+
+    parser = build_parser()
+
     # Parse arguments
     args = parser.parse_args()
 
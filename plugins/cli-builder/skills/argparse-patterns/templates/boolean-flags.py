@@ -10,9 +10,12 @@ Usage:
 
 import argparse
 import sys
+from functools import lru_cache
 
 
-def main():
+@lru_cache(maxsize=None)
+def build_parser():
+    """Build the argument parser once; later calls reuse it."""
     parser = argparse.ArgumentParser(
         description='Boolean flag patterns',
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -112,6 +115,12 @@ def main():
         help='Run in interactive mode'
     )
 
+    return parser
+
+
+def main():
+    parser = build_parser()
+
     # Parse arguments
     args = parser.parse_args()
 
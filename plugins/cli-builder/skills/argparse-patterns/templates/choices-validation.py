@@ -9,58 +9,98 @@ Usage:
 """
 
 import argparse
-import re
+import ipaddress
+import string
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+class Choices(frozenset):
+    """Frozenset of choices that iterates in declaration order for help output."""
+
+    __slots__ = ('_order',)
+
+    def __new__(cls, *values):
+        self = super().__new__(cls, values)
+        self._order = tuple(dict.fromkeys(values))
+        return self
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __reduce__(self):
+        # frozenset's own __reduce__ passes one iterable, not *values
+        return (type(self), self._order)
+
+
+# Allowed characters for the email local part and domain
+EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+
+LOG_LEVELS = Choices('debug', 'info', 'warning', 'error', 'critical')
+REGIONS = Choices(
+    'us-east-1', 'us-west-1', 'us-west-2',
+    'eu-west-1', 'eu-central-1',
+    'ap-southeast-1', 'ap-northeast-1',
+)
+FORMATS = Choices('json', 'yaml', 'toml', 'xml')
+INSTANCE_TYPES = Choices('t2.micro', 't2.small', 't2.medium', 't3.large')
+
+
 def validate_port(value):
     """Custom validator for port numbers."""
-    try:
+    # Reject non-digits and overlong input before calling int()
+    if value.isascii() and value.isdigit() and len(value) <= 5:
         ivalue = int(value)
-    except ValueError:
-        raise argparse.ArgumentTypeError(f"{value} is not a valid integer")
+        if 1 <= ivalue <= 65535:
+            return ivalue
 
-    if ivalue < 1 or ivalue > 65535:
-        raise argparse.ArgumentTypeError(
-            f"{value} is not a valid port (must be 1-65535)"
-        )
-    return ivalue
+    raise argparse.ArgumentTypeError(
+        f"{value} is not a valid port (must be 1-65535)"
+    )
 
 
 def validate_ip(value):
     """Custom validator for IP addresses."""
-    pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-    if not re.match(pattern, value):
+    try:
+        return str(ipaddress.IPv4Address(value))
+    except ValueError:
         raise argparse.ArgumentTypeError(f"{value} is not a valid IP address")
 
-    # Check each octet is 0-255
-    octets = [int(x) for x in value.split('.')]
-    if any(o < 0 or o > 255 for o in octets):
-        raise argparse.ArgumentTypeError(
-            f"{value} contains invalid octets (must be 0-255)"
-        )
-    return value
-
 
 def validate_email(value):
     """Custom validator for email addresses."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, value):
+    # Character-class checks on each part instead of a regex; lengths follow
+    # the RFC 5321 limits
+    local, at, domain = value.rpartition('@')
+    host, dot, tld = domain.rpartition('.')
+    if not (
+        at and dot
+        and 1 <= len(local) <= 64
+        and 1 <= len(host) <= 255
+        and 2 <= len(tld) <= 24
+        and tld.isascii() and tld.isalpha()
+        and EMAIL_LOCAL_CHARS.issuperset(local)
+        and EMAIL_DOMAIN_CHARS.issuperset(host)
+    ):
         raise argparse.ArgumentTypeError(f"{value} is not a valid email address")
     return value
 
 
-def validate_path_exists(value):
-    """Custom validator to check if path exists."""
-    path = Path(value)
-    if not path.exists():
-        raise argparse.ArgumentTypeError(f"Path does not exist: {value}")
-    return path
+def validate_paths(parser, args):
+    """Check that path arguments exist, once parsing has succeeded.
+
+    Done after parse_args() rather than as a type= converter so that --help
+    and parse errors never touch the filesystem.
+    """
+    if args.config and not args.config.exists():
+        parser.error(f"Path does not exist: {args.config}")
 
 
+@lru_cache(maxsize=None)
 def validate_range(min_val, max_val):
-    """Factory function for range validators."""
+    """Factory function for range validators (cached per bounds pair)."""
     def validator(value):
         try:
             ivalue = int(value)
@@ -84,25 +124,21 @@ def main():
     # ===== String Choices =====
     parser.add_argument(
         '--log-level',
-        choices=['debug', 'info', 'warning', 'error', 'critical'],
+        choices=LOG_LEVELS,
         default='info',
         help='Logging level (default: %(default)s)'
     )
 
     parser.add_argument(
         '--region',
-        choices=[
-            'us-east-1', 'us-west-1', 'us-west-2',
-            'eu-west-1', 'eu-central-1',
-            'ap-southeast-1', 'ap-northeast-1'
-        ],
+        choices=REGIONS,
         default='us-east-1',
         help='AWS region (default: %(default)s)'
     )
 
     parser.add_argument(
         '--format',
-        choices=['json', 'yaml', 'toml', 'xml'],
+        choices=FORMATS,
         default='json',
         help='Output format (default: %(default)s)'
     )
@@ -130,7 +166,7 @@ def main():
 
     parser.add_argument(
         '--config',
-        type=validate_path_exists,
+        type=Path,
         help='Path to configuration file (must exist)'
     )
 
@@ -152,7 +188,7 @@ def main():
     # ===== Integer Choices =====
     parser.add_argument(
         '--instance-type',
-        choices=['t2.micro', 't2.small', 't2.medium', 't3.large'],
+        choices=INSTANCE_TYPES,
         default='t2.micro',
         help='EC2 instance type (default: %(default)s)'
     )
@@ -174,21 +210,24 @@ def main():
 
     # Parse arguments
     args = parser.parse_args()
-
-    # Display parsed values
-    print("Configuration:")
-    print(f"  Log Level: {args.log_level}")
-    print(f"  Region: {args.region}")
-    print(f"  Format: {args.format}")
-    print(f"  Port: {args.port}")
-    print(f"  Host: {args.host}")
-    print(f"  Email: {args.email}")
-    print(f"  Config: {args.config}")
-    print(f"  Workers: {args.workers}")
-    print(f"  Timeout: {args.timeout}s")
-    print(f"  Instance Type: {args.instance_type}")
-    print(f"  Memory: {args.memory}GB")
-    print(f"  Retry Count: {args.retry_count}")
+    validate_paths(parser, args)
+
+    # Display parsed values in a single write
+    sys.stdout.write(
+        "Configuration:\n"
+        f"  Log Level: {args.log_level}\n"
+        f"  Region: {args.region}\n"
+        f"  Format: {args.format}\n"
+        f"  Port: {args.port}\n"
+        f"  Host: {args.host}\n"
+        f"  Email: {args.email}\n"
+        f"  Config: {args.config}\n"
+        f"  Workers: {args.workers}\n"
+        f"  Timeout: {args.timeout}s\n"
+        f"  Instance Type: {args.instance_type}\n"
+        f"  Memory: {args.memory}GB\n"
+        f"  Retry Count: {args.retry_count}\n"
+    )
 
     return 0
 
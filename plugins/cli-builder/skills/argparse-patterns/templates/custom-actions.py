@@ -21,14 +21,15 @@ class LoadEnvFileAction(argparse.Action):
         if not env_file.exists():
             parser.error(f"Environment file does not exist: {values}")
 
-        env_vars = {}
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        env_vars[key.strip()] = value.strip()
+        # Read the whole file in one call and split it once; partition()
+        # splits each line in a single pass, and lines without '='
+        # (including blanks) come back with an empty separator
+        env_vars = {
+            key.strip().decode(): value.strip().decode()
+            for line in env_file.read_bytes().splitlines()
+            for key, sep, value in [line.strip().partition(b'=')]
+            if sep and not key.startswith(b'#')
+        }
 
         setattr(namespace, self.dest, env_vars)
 
@@ -41,9 +42,12 @@ class KeyValueAction(argparse.Action):
             parser.error(f"Argument must be in key=value format: {values}")
 
         key, value = values.split('=', 1)
-        items = getattr(namespace, self.dest, None) or {}
+        items = getattr(namespace, self.dest, None)
+        # Copy the parser default once per parse, then update in place
+        if items is None or items is self.default:
+            items = dict(items or {})
+            setattr(namespace, self.dest, items)
         items[key] = value
-        setattr(namespace, self.dest, items)
 
 
 class RangeAction(argparse.Action):
@@ -63,19 +67,23 @@ class RangeAction(argparse.Action):
         if start > end:
             parser.error(f"Start must be less than or equal to end: {values}")
 
-        ranges = getattr(namespace, self.dest, None) or []
+        ranges = getattr(namespace, self.dest, None)
+        if ranges is None or ranges is self.default:
+            ranges = list(ranges or [])
+            setattr(namespace, self.dest, ranges)
         ranges.append((start, end))
-        setattr(namespace, self.dest, ranges)
 
 
 class AppendUniqueAction(argparse.Action):
     """Custom action to append unique values only."""
 
     def __call__(self, parser, namespace, values, option_string=None):
-        items = getattr(namespace, self.dest, None) or []
+        items = getattr(namespace, self.dest, None)
+        if items is None or items is self.default:
+            items = list(items or [])
+            setattr(namespace, self.dest, items)
         if values not in items:
             items.append(values)
-        setattr(namespace, self.dest, items)
 
 
 class ValidateAndStoreAction(argparse.Action):
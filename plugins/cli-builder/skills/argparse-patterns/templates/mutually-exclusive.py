@@ -9,6 +9,7 @@ Usage:
     python mutually-exclusive.py --quiet
     python mutually-exclusive.py --create resource
     python mutually-exclusive.py --delete resource
+    python mutually-exclusive.py --list --strategy canary
 """
 
 import argparse
@@ -93,26 +94,15 @@ def main():
         help='Authenticate with credentials file'
     )
 
-    # ===== Deployment Strategy (mutually exclusive with default) =====
-    strategy_group = parser.add_mutually_exclusive_group()
-    strategy_group.add_argument(
-        '--rolling',
-        action='store_true',
-        help='Use rolling deployment'
-    )
-    strategy_group.add_argument(
-        '--blue-green',
-        action='store_true',
-        help='Use blue-green deployment'
+    # ===== Deployment Strategy (single choice instead of exclusive flags) =====
+    # One option with choices= gives the same "pick at most one" semantics
+    # as a group of store_true flags, with a single action to parse
+    parser.add_argument(
+        '--strategy',
+        choices=['rolling', 'blue-green', 'canary'],
+        default=None,
+        help='Deployment strategy'
     )
-    strategy_group.add_argument(
-        '--canary',
-        action='store_true',
-        help='Use canary deployment'
-    )
-
-    # Set default strategy if none specified
-    parser.set_defaults(rolling=False, blue_green=False, canary=False)
 
     # Parse arguments
     args = parser.parse_args()
@@ -159,14 +149,12 @@ def main():
         print("  Auth Method: None")
 
     # Deployment strategy
-    if args.rolling:
-        print("  Deployment: Rolling")
-    elif args.blue_green:
-        print("  Deployment: Blue-Green")
-    elif args.canary:
-        print("  Deployment: Canary")
-    else:
-        print("  Deployment: Default")
+    strategy_labels = {
+        'rolling': 'Rolling',
+        'blue-green': 'Blue-Green',
+        'canary': 'Canary',
+    }
+    print(f"  Deployment: {strategy_labels.get(args.strategy, 'Default')}")
 
     return 0
 
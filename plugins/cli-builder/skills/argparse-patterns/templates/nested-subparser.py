@@ -12,6 +12,29 @@ Usage:
 
 import argparse
 import sys
+from functools import lru_cache
+
+
+class Choices(frozenset):
+    """Frozenset of choices that iterates in declaration order for help output."""
+
+    __slots__ = ('_order',)
+
+    def __new__(cls, *values):
+        self = super().__new__(cls, values)
+        self._order = tuple(dict.fromkeys(values))
+        return self
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __reduce__(self):
+        # frozenset's own __reduce__ passes one iterable, not *values
+        return (type(self), self._order)
+
+
+ENVIRONMENTS = Choices('development', 'staging', 'production')
+OUTPUT_FORMATS = Choices('text', 'json', 'yaml')
 
 
 # Config command handlers
@@ -64,23 +87,9 @@ def deploy_restart(args):
         print("(Hard restart)")
 
 
-def main():
-    # Main parser
-    parser = argparse.ArgumentParser(
-        description='Multi-level CLI tool with nested subcommands',
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-
-    parser.add_argument('--version', action='version', version='1.0.0')
-
-    # Top-level subparsers
-    subparsers = parser.add_subparsers(
-        dest='command',
-        help='Top-level commands',
-        required=True
-    )
-
-    # ===== Config command group =====
+# ===== Config command group =====
+def add_config_parser(subparsers):
+    """Add the config command and its get/set/list/delete subcommands."""
     config_parser = subparsers.add_parser(
         'config',
         help='Manage configuration',
@@ -123,7 +132,7 @@ def main():
     )
     config_list_parser.add_argument(
         '--format',
-        choices=['text', 'json', 'yaml'],
+        choices=OUTPUT_FORMATS,
         default='text',
         help='Output format (default: %(default)s)'
     )
@@ -142,7 +151,10 @@ def main():
     )
     config_delete_parser.set_defaults(func=config_delete)
 
-    # ===== Deploy command group =====
+
+# ===== Deploy command group =====
+def add_deploy_parser(subparsers):
+    """Add the deploy command and its start/stop/restart subcommands."""
     deploy_parser = subparsers.add_parser(
         'deploy',
         help='Manage deployments',
@@ -163,7 +175,7 @@ def main():
     )
     deploy_start_parser.add_argument(
         'environment',
-        choices=['development', 'staging', 'production'],
+        choices=ENVIRONMENTS,
         help='Target environment'
     )
     deploy_start_parser.add_argument(
@@ -186,7 +198,7 @@ def main():
     )
     deploy_stop_parser.add_argument(
         'environment',
-        choices=['development', 'staging', 'production'],
+        choices=ENVIRONMENTS,
         help='Target environment'
     )
     deploy_stop_parser.set_defaults(func=deploy_stop)
@@ -198,7 +210,7 @@ def main():
     )
     deploy_restart_parser.add_argument(
         'environment',
-        choices=['development', 'staging', 'production'],
+        choices=ENVIRONMENTS,
         help='Target environment'
     )
     deploy_restart_parser.add_argument(
@@ -208,8 +220,57 @@ def main():
     )
     deploy_restart_parser.set_defaults(func=deploy_restart)
 
-    # Parse arguments
-    args = parser.parse_args()
+
+COMMAND_GROUPS = {
+    'config': add_config_parser,
+    'deploy': add_deploy_parser,
+}
+
+
+@lru_cache(maxsize=None)
+def build_parser(command=None):
+    """Build the parser for one command group, or all of them when None.
+
+    Later calls with the same group reuse the parser.
+    """
+    # Main parser
+    parser = argparse.ArgumentParser(
+        description='Multi-level CLI tool with nested subcommands',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument('--version', action='version', version='1.0.0')
+
+    # Top-level subparsers
+    subparsers = parser.add_subparsers(
+        dest='command',
+        help='Top-level commands',
+        required=True
+    )
+
+    if command is None:
+        for add_group in COMMAND_GROUPS.values():
+            add_group(subparsers)
+    else:
+        COMMAND_GROUPS[command](subparsers)
+
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Only the group named by the first positional is built; top-level help,
+    # --version and unknown commands get every group so the output is complete
+    command = next((arg for arg in argv if not arg.startswith('-')), None)
+    if command not in COMMAND_GROUPS:
+        command = None
+
+    # Parse arguments; leftovers are reported by the full parser so the
+    # top-level usage in the error lists every command group
+    args, extras = build_parser(command).parse_known_args(argv)
+    if extras:
+        args = build_parser(None).parse_args(argv)
 
     # Call the appropriate command function
     return args.func(args)
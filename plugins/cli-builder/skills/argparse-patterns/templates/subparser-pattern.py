@@ -8,8 +8,33 @@ Usage:
     python subparser-pattern.py status --format json
 """
 
-import argparse
 import sys
+from types import SimpleNamespace
+
+# argparse is only imported when the fast path below hands over to it
+
+
+class Choices(frozenset):
+    """Frozenset of choices that iterates in declaration order for help output."""
+
+    __slots__ = ('_order',)
+
+    def __new__(cls, *values):
+        self = super().__new__(cls, values)
+        self._order = tuple(dict.fromkeys(values))
+        return self
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __reduce__(self):
+        # frozenset's own __reduce__ passes one iterable, not *values
+        return (type(self), self._order)
+
+
+ENVIRONMENTS = Choices('development', 'staging', 'production')
+DEPLOY_MODES = Choices('fast', 'safe', 'rollback')
+OUTPUT_FORMATS = Choices('text', 'json', 'yaml')
 
 
 def cmd_init(args):
@@ -31,7 +56,10 @@ def cmd_status(args):
     print("Fetching status...")
 
 
-def main():
+def build_parser():
+    """Build the full argparse parser for help, --version and error reporting."""
+    import argparse
+
     # Main parser
     parser = argparse.ArgumentParser(
         description='Multi-command CLI tool',
@@ -77,7 +105,7 @@ def main():
     )
     deploy_parser.add_argument(
         'environment',
-        choices=['development', 'staging', 'production'],
+        choices=ENVIRONMENTS,
         help='Target environment'
     )
     deploy_parser.add_argument(
@@ -87,7 +115,7 @@ def main():
     )
     deploy_parser.add_argument(
         '--mode', '-m',
-        choices=['fast', 'safe', 'rollback'],
+        choices=DEPLOY_MODES,
         default='safe',
         help='Deployment mode (default: %(default)s)'
     )
@@ -101,7 +129,7 @@ def main():
     )
     status_parser.add_argument(
         '--format',
-        choices=['text', 'json', 'yaml'],
+        choices=OUTPUT_FORMATS,
         default='text',
         help='Output format (default: %(default)s)'
     )
@@ -112,8 +140,93 @@ def main():
     )
     status_parser.set_defaults(func=cmd_status)
 
-    # Parse arguments
-    args = parser.parse_args()
+    return parser
+
+
+# Fast path: command -> (positionals, {option: (dest, action)}, defaults)
+FAST_COMMANDS = {
+    'init': (
+        (),
+        {
+            '--template': ('template', 'store'), '-t': ('template', 'store'),
+            '--path': ('path', 'store'), '-p': ('path', 'store'),
+        },
+        {'template': 'basic', 'path': '.'},
+    ),
+    'deploy': (
+        ('environment',),
+        {
+            '--force': ('force', 'store_true'), '-f': ('force', 'store_true'),
+            '--mode': ('mode', 'store'), '-m': ('mode', 'store'),
+        },
+        {'force': False, 'mode': 'safe'},
+    ),
+    'status': (
+        (),
+        {'--format': ('format', 'store'), '--service': ('service', 'append')},
+        {'format': 'text', 'service': None},
+    ),
+}
+FAST_CHOICES = {
+    'environment': ENVIRONMENTS,
+    'mode': DEPLOY_MODES,
+    'format': OUTPUT_FORMATS,
+}
+COMMAND_FUNCS = {'init': cmd_init, 'deploy': cmd_deploy, 'status': cmd_status}
+
+
+def fast_parse(argv):
+    """Parse plain invocations in one pass over argv without argparse.
+
+    Returns None for anything it does not fully accept (help, abbreviations,
+    --opt=value, bad values, ...) so argparse can handle it and report errors.
+    """
+    if not argv or argv[0] not in FAST_COMMANDS:
+        return None
+
+    command = argv[0]
+    positionals, options, defaults = FAST_COMMANDS[command]
+    values = dict(defaults)
+    position = 0
+    args = iter(argv[1:])
+    for arg in args:
+        if arg.startswith('-'):
+            spec = options.get(arg)
+            if spec is None:
+                return None
+            dest, action = spec
+            if action == 'store_true':
+                values[dest] = True
+                continue
+            value = next(args, None)
+            if value is None or value.startswith('-'):
+                return None
+            if action == 'append':
+                values[dest] = [*(values[dest] or ()), value]
+            else:
+                values[dest] = value
+        elif position < len(positionals):
+            values[positionals[position]] = arg
+            position += 1
+        else:
+            return None
+
+    if position < len(positionals):
+        return None
+    for dest, allowed in FAST_CHOICES.items():
+        if dest in values and values[dest] not in allowed:
+            return None
+
+    return SimpleNamespace(command=command, func=COMMAND_FUNCS[command], **values)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Plain invocations skip building the parser entirely
+    args = fast_parse(argv)
+    if args is None:
+        args = build_parser().parse_args(argv)
 
     # Call the appropriate command function
     return args.func(args)
@@ -5,27 +5,54 @@ Type coercion and custom type converters.
 Usage:
     python type-coercion.py --port 8080 --timeout 30.5 --date 2024-01-15
     python type-coercion.py --url https://api.example.com --size 1.5GB
+    python type-coercion.py --ids 1,2,3 --ratios 0.5,1.25
 """
 
 import argparse
 import sys
-from datetime import datetime
-from pathlib import Path
 import re
 
+# datetime and pathlib are imported inside the converters that need them so
+# that --help and runs without those options skip loading them. re is already
+# imported by argparse, so the patterns below are compiled up front.
+
+# Host length is bounded so a long dotted host cannot cause heavy backtracking
+URL_PATTERN = re.compile(r'^https?://[a-zA-Z0-9.-]{1,253}\.[a-zA-Z]{2,24}(/.*)?$')
+
+# One combined pattern for sizes, durations and percentages; the branch that
+# matched is reported by match.lastgroup ('size_unit', 'duration_unit', 'pct')
+QUANTITY_PATTERN = re.compile(
+    r'^(?:(?P<size>\d+\.?\d*)(?P<size_unit>[bB]|[kK][bB]|[mM][bB]|[gG][bB]|[tT][bB])'
+    r'|(?P<duration>\d+)(?P<duration_unit>[sSmMhHdD])'
+    r'|(?P<pct>\d+\.?\d*)%?)$'
+)
+# Size units as powers of two (bytes = size << shift)
+SIZE_SHIFTS = {'b': 0, 'kb': 10, 'mb': 20, 'gb': 30, 'tb': 40}
+DURATION_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
 
 def parse_date(value):
     """Parse date in YYYY-MM-DD format."""
-    try:
-        return datetime.strptime(value, '%Y-%m-%d').date()
-    except ValueError:
-        raise argparse.ArgumentTypeError(
-            f"Invalid date format: {value} (expected YYYY-MM-DD)"
-        )
+    from datetime import date
+
+    # Fixed-width format: slice the fields directly instead of strptime()
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        year, month, day = value[0:4], value[5:7], value[8:10]
+        if year.isdigit() and month.isdigit() and day.isdigit():
+            try:
+                return date(int(year), int(month), int(day))
+            except ValueError:
+                pass
+
+    raise argparse.ArgumentTypeError(
+        f"Invalid date format: {value} (expected YYYY-MM-DD)"
+    )
 
 
 def parse_datetime(value):
     """Parse datetime in ISO format."""
+    from datetime import datetime
+
     try:
         return datetime.fromisoformat(value)
     except ValueError:
@@ -34,54 +61,52 @@ def parse_datetime(value):
         )
 
 
+def parse_path(value):
+    """Convert to a Path object."""
+    from pathlib import Path
+
+    return Path(value)
+
+
 def parse_url(value):
     """Parse and validate URL."""
-    pattern = r'^https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(/.*)?$'
-    if not re.match(pattern, value):
+    if not URL_PATTERN.match(value):
         raise argparse.ArgumentTypeError(f"Invalid URL: {value}")
     return value
 
 
 def parse_size(value):
     """Parse size with units (e.g., 1.5GB, 500MB)."""
-    pattern = r'^(\d+\.?\d*)(B|KB|MB|GB|TB)$'
-    match = re.match(pattern, value, re.IGNORECASE)
-    if not match:
+    match = QUANTITY_PATTERN.match(value)
+    if not match or match.lastgroup != 'size_unit':
         raise argparse.ArgumentTypeError(
             f"Invalid size format: {value} (expected number with unit)"
         )
 
-    size, unit = match.groups()
-    size = float(size)
-
-    units = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3, 'TB': 1024**4}
-    return int(size * units[unit.upper()])
+    size = float(match.group('size'))
+    return int(size * (1 << SIZE_SHIFTS[match.group('size_unit').lower()]))
 
 
 def parse_duration(value):
     """Parse duration (e.g., 1h, 30m, 90s)."""
-    pattern = r'^(\d+)(s|m|h|d)$'
-    match = re.match(pattern, value, re.IGNORECASE)
-    if not match:
+    match = QUANTITY_PATTERN.match(value)
+    if not match or match.lastgroup != 'duration_unit':
         raise argparse.ArgumentTypeError(
             f"Invalid duration format: {value} (expected number with s/m/h/d)"
         )
 
-    amount, unit = match.groups()
-    amount = int(amount)
-
-    units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
-    return amount * units[unit.lower()]
+    amount = int(match.group('duration'))
+    return amount * DURATION_SECONDS[match.group('duration_unit').lower()]
 
 
 def parse_percentage(value):
     """Parse percentage (0-100)."""
-    try:
-        pct = float(value.rstrip('%'))
-    except ValueError:
+    match = QUANTITY_PATTERN.match(value)
+    if not match or match.lastgroup != 'pct':
         raise argparse.ArgumentTypeError(f"Invalid percentage: {value}")
 
-    if pct < 0 or pct > 100:
+    pct = float(match.group('pct'))
+    if pct > 100:
         raise argparse.ArgumentTypeError(
             f"Percentage must be between 0 and 100: {value}"
         )
@@ -90,15 +115,31 @@ def parse_percentage(value):
 
 def parse_comma_separated(value):
     """Parse comma-separated list."""
-    return [item.strip() for item in value.split(',') if item.strip()]
+    return list(filter(None, map(str.strip, value.split(','))))
+
+
+def parse_int_list(value):
+    """Parse comma-separated integers in one pass (e.g., 1,2,3)."""
+    try:
+        return list(map(int, value.split(',')))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid integer list: {value}")
+
+
+def parse_float_list(value):
+    """Parse comma-separated floats in one pass (e.g., 0.5,1.25)."""
+    try:
+        return list(map(float, value.split(',')))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid float list: {value}")
 
 
 def parse_key_value_pairs(value):
     """Parse semicolon-separated key=value pairs."""
     pairs = {}
     for pair in value.split(';'):
-        if '=' in pair:
-            key, val = pair.split('=', 1)
+        key, sep, val = pair.partition('=')
+        if sep:
             pairs[key.strip()] = val.strip()
     return pairs
 
@@ -126,20 +167,20 @@ def main():
 
     parser.add_argument(
         '--config',
-        type=Path,
+        type=parse_path,
         help='Configuration file path'
     )
 
     parser.add_argument(
         '--output',
-        type=argparse.FileType('w'),
-        help='Output file (opened for writing)'
+        type=parse_path,
+        help='Output file (opened for writing when used)'
     )
 
     parser.add_argument(
         '--input',
-        type=argparse.FileType('r'),
-        help='Input file (opened for reading)'
+        type=parse_path,
+        help='Input file (opened for reading when used)'
     )
 
     # ===== Custom Types =====
@@ -192,18 +233,17 @@ def main():
     )
 
     # ===== List Types =====
+    # One converter call per option instead of one per token
     parser.add_argument(
         '--ids',
-        type=int,
-        nargs='+',
-        help='List of integer IDs'
+        type=parse_int_list,
+        help='Comma-separated integer IDs (e.g., 1,2,3)'
     )
 
     parser.add_argument(
         '--ratios',
-        type=float,
-        nargs='*',
-        help='List of float ratios'
+        type=parse_float_list,
+        help='Comma-separated float ratios (e.g., 0.5,1.25)'
     )
 
     # Parse arguments
@@ -217,6 +257,13 @@ def main():
     print(f"  Timeout (float): {args.timeout} - type: {type(args.timeout).__name__}")
     if args.config:
         print(f"  Config (Path): {args.config} - type: {type(args.config).__name__}")
+    # Files are kept as paths and only opened where they are actually used,
+    # e.g. `with args.output.open('w') as f: ...`, so a parse error on a later
+    # argument never leaves an output file truncated
+    if args.input:
+        print(f"  Input (Path): {args.input}")
+    if args.output:
+        print(f"  Output (Path): {args.output}")
 
     print("\nCustom Types:")
     if args.date:
@@ -244,12 +291,6 @@ def main():
     if args.ratios:
         print(f"  Ratios: {args.ratios}")
 
-    # Clean up file handles
-    if args.output:
-        args.output.close()
-    if args.input:
-        args.input.close()
-
     return 0
 
 
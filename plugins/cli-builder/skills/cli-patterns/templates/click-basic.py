@@ -1,52 +1,138 @@
 #!/usr/bin/env python3
 # Python equivalent using click (similar API to urfave/cli)
+# click is only imported for help, --version and error reporting; plain
+# invocations are dispatched by fast_parse() without it
 
-import click
-
-@click.group()
-@click.version_option('0.1.0')
-@click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
-@click.option('--config', '-c', envvar='CONFIG_PATH', help='Path to config file')
-@click.pass_context
-def cli(ctx, verbose, config):
-    """A simple CLI application"""
-    ctx.ensure_object(dict)
-    ctx.obj['verbose'] = verbose
-    ctx.obj['config'] = config
-
-    if verbose:
-        click.echo('Verbose mode enabled')
-
-    if config:
-        click.echo(f'Using config: {config}')
-
-@cli.command()
-@click.option('--port', '-p', default=8080, help='Port to listen on')
-@click.pass_context
-def start(ctx, port):
+import os
+import sys
+
+def announce(obj):
+    """Report the global options, like the group callback"""
+    if obj['verbose']:
+        print('Verbose mode enabled')
+
+    if obj['config']:
+        print(f"Using config: {obj['config']}")
+
+def start(obj, port=8080):
     """Start the service"""
-    if ctx.obj['verbose']:
-        click.echo(f'Starting service on port {port}')
+    if obj['verbose']:
+        print(f'Starting service on port {port}')
     else:
-        click.echo(f'Starting on port {port}')
+        print(f'Starting on port {port}')
 
-@cli.command()
-@click.pass_context
-def stop(ctx):
+def stop(obj):
     """Stop the service"""
-    click.echo('Stopping service...')
+    print('Stopping service...')
 
-@cli.command()
-def status():
+def status(obj):
     """Check service status"""
-    click.echo('Service is running')
+    print('Service is running')
 
-@cli.command()
-@click.argument('key')
-@click.argument('value')
-def config(key, value):
+def set_config(obj, key, value):
     """Set configuration value"""
-    click.echo(f'Setting {key} = {value}')
+    print(f'Setting {key} = {value}')
+
+def build_cli():
+    """Build the click group with the same commands and help text"""
+    import click
+
+    @click.group()
+    @click.version_option('0.1.0')
+    @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
+    @click.option('--config', '-c', envvar='CONFIG_PATH', help='Path to config file')
+    @click.pass_context
+    def cli(ctx, verbose, config):
+        """A simple CLI application"""
+        ctx.ensure_object(dict)
+        ctx.obj['verbose'] = verbose
+        ctx.obj['config'] = config
+        announce(ctx.obj)
+
+    @cli.command('start')
+    @click.option('--port', '-p', default=8080, help='Port to listen on')
+    @click.pass_obj
+    def start_command(obj, port):
+        """Start the service"""
+        start(obj, port)
+
+    @cli.command('stop')
+    @click.pass_obj
+    def stop_command(obj):
+        """Stop the service"""
+        stop(obj)
+
+    @cli.command('status')
+    @click.pass_obj
+    def status_command(obj):
+        """Check service status"""
+        status(obj)
+
+    @cli.command('config')
+    @click.argument('key')
+    @click.argument('value')
+    @click.pass_obj
+    def config_command(obj, key, value):
+        """Set configuration value"""
+        set_config(obj, key, value)
+
+    return cli
+
+# Fast path: command -> (handler, number of positionals, {option: param})
+COMMANDS = {
+    'start': (start, 0, {'--port': 'port', '-p': 'port'}),
+    'stop': (stop, 0, {}),
+    'status': (status, 0, {}),
+    'config': (set_config, 2, {}),
+}
+
+def fast_parse(argv):
+    """Parse plain invocations in one pass; None means let click handle it"""
+    obj = {'verbose': False, 'config': os.environ.get('CONFIG_PATH') or None}
+    args = iter(argv)
+    for arg in args:
+        if arg in ('-v', '--verbose'):
+            obj['verbose'] = True
+        elif arg in ('-c', '--config'):
+            obj['config'] = next(args, None)
+            if obj['config'] is None or obj['config'].startswith('-'):
+                return None
+        elif arg in COMMANDS:
+            break
+        else:
+            return None
+    else:
+        return None
+
+    handler, positional_count, options = COMMANDS[arg]
+    positionals = []
+    params = {}
+    for arg in args:
+        if arg in options:
+            value = next(args, None)
+            # --port is the only option and click would convert it to int
+            if value is None or not (value.isascii() and value.isdigit()):
+                return None
+            params[options[arg]] = int(value)
+        elif arg.startswith('-') or len(positionals) == positional_count:
+            return None
+        else:
+            positionals.append(arg)
+
+    if len(positionals) != positional_count:
+        return None
+    return obj, handler, positionals, params
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parsed = fast_parse(argv)
+    if parsed is None:
+        build_cli()(args=argv, obj={})
+        return
+
+    obj, handler, positionals, params = parsed
+    announce(obj)
+    handler(obj, *positionals, **params)
 
 if __name__ == '__main__':
-    cli(obj={})
+    main()
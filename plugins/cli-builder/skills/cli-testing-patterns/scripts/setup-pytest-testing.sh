@@ -27,6 +27,7 @@ pip3 install --upgrade \
     pytest \
     pytest-cov \
     pytest-mock \
+    pytest-xdist \
     click
 
 # Create pytest configuration
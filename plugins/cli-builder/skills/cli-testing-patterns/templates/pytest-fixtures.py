@@ -7,25 +7,31 @@ Provides common setup, teardown, and test utilities
 
 import pytest
 import os
-import tempfile
-import shutil
 from pathlib import Path
-from click.testing import CliRunner
-from mycli.cli import cli
+
+# click and the CLI under test are imported inside the fixtures that use
+# them, so collecting tests that never run the CLI does not pay for either
 
 
 # Basic Fixtures
 
-@pytest.fixture
+@pytest.fixture(scope='session')
+def cli():
+    """Import the CLI under test once, when a test first needs it"""
+    from mycli.cli import cli
+    return cli
+
+
+@pytest.fixture(scope='session')
 def runner():
-    """Create a CliRunner instance for testing"""
+    """Create one CliRunner shared by the whole session (it holds no per-test state)"""
+    from click.testing import CliRunner
     return CliRunner()
 
 
 @pytest.fixture
-def isolated_runner():
-    """Create a CliRunner with isolated filesystem"""
-    runner = CliRunner()
+def isolated_runner(runner):
+    """Run the shared CliRunner inside a fresh isolated filesystem"""
     with runner.isolated_filesystem():
         yield runner
 
@@ -164,7 +170,7 @@ def clean_state(temp_workspace):
 # Helper Function Fixtures
 
 @pytest.fixture
-def run_cli_command(runner):
+def run_cli_command(runner, cli):
     """Helper function to run CLI commands and return parsed results"""
     def _run(args, input_data=None, env=None):
         """
@@ -189,7 +195,7 @@ def run_cli_command(runner):
 
 
 @pytest.fixture
-def assert_cli_success(runner):
+def assert_cli_success(runner, cli):
     """Helper to assert successful CLI execution"""
     def _assert(args, expected_in_output=None):
         """
@@ -208,7 +214,7 @@ def assert_cli_success(runner):
 
 
 @pytest.fixture
-def assert_cli_failure(runner):
+def assert_cli_failure(runner, cli):
     """Helper to assert CLI command failure"""
     def _assert(args, expected_in_output=None):
         """
@@ -228,9 +234,13 @@ def assert_cli_failure(runner):
 
 # Cleanup Fixtures
 
-@pytest.fixture(autouse=True)
-def cleanup_temp_files(request):
-    """Automatically clean up temporary files after tests"""
+@pytest.fixture
+def register_temp_file(request):
+    """Remove files registered by the test once it finishes
+
+    Opt-in: only for files created outside tmp_path, which pytest already
+    cleans up for every test.
+    """
     temp_files = []
 
     def _register(filepath):
@@ -272,7 +282,7 @@ def environment(request):
 # Integration Test Fixtures
 
 @pytest.fixture
-def integration_workspace(tmp_path):
+def integration_workspace(tmp_path, runner, cli):
     """
     Create a complete integration test workspace with all necessary files
     """
@@ -290,7 +300,6 @@ def integration_workspace(tmp_path):
     (workspace / 'config' / 'prod.yaml').write_text('env: production\n')
 
     # Initialize CLI
-    runner = CliRunner()
     with runner.isolated_filesystem(temp_dir=workspace):
         runner.invoke(cli, ['init'])
 
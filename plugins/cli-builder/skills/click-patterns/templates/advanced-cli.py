@@ -12,12 +12,29 @@ Demonstrates advanced patterns including:
 
 import click
 import logging
-from rich.console import Console
+import os
 from pathlib import Path
 import json
+from functools import lru_cache
 from typing import Optional
 
-console = Console()
+try:
+    import orjson
+except ImportError:  # optional: faster config (de)serialization when installed
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def get_console():
+    """Create the rich Console on first use
+
+    Importing rich and probing the terminal is deferred, so --help, --version
+    and commands that print nothing never pay for it.
+    """
+    from rich.console import Console
+
+    return Console()
+
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +43,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Option choices, defined once and shared by the decorators below
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+TEMPLATES = ('basic', 'advanced', 'api')
+ENVIRONMENTS = ('dev', 'staging', 'prod')
+EXPORT_FORMATS = ('json', 'yaml', 'env')
+DATA_FORMATS = ('json', 'csv', 'xml')
+
 
 # Custom parameter types
 class JsonType(click.ParamType):
@@ -39,16 +63,33 @@ class JsonType(click.ParamType):
             self.fail(f'Invalid JSON: {e}', param, ctx)
 
 
+@lru_cache(maxsize=256)
+def _parse_pathlist(value: str, cwd: str) -> tuple:
+    """Split and check a path list once per (value, working directory)
+
+    Raises FileNotFoundError for a missing path; failures are not cached.
+    """
+    paths = tuple(Path(p.strip()) for p in value.split(','))
+    for path in paths:
+        if not path.exists():
+            raise FileNotFoundError(path)
+    return paths
+
+
 class PathListType(click.ParamType):
     """Custom type for comma-separated paths"""
     name = 'pathlist'
 
     def convert(self, value, param, ctx):
-        paths = [Path(p.strip()) for p in value.split(',')]
-        for path in paths:
-            if not path.exists():
-                self.fail(f'Path does not exist: {path}', param, ctx)
-        return paths
+        try:
+            return _parse_pathlist(value, os.getcwd())
+        except FileNotFoundError as e:
+            self.fail(f'Path does not exist: {e}', param, ctx)
+
+
+# Parsed config files keyed by (path, mtime_ns), so repeated invocations in
+# one process (e.g. CliRunner tests) only parse a file again after it changes
+_config_cache = {}
 
 
 # Configuration class
@@ -60,28 +101,60 @@ class Config:
         self.log_level = 'INFO'
         self.config_file = 'config.json'
         self._data = {}
+        self._dirty = False
+        self._pending_load = False
 
     def load(self, config_file: Optional[str] = None):
         """Load configuration from file"""
         file_path = Path(config_file or self.config_file)
-        if file_path.exists():
-            with open(file_path) as f:
-                self._data = json.load(f)
-            logger.info(f"Loaded config from {file_path}")
+        try:
+            cache_key = (str(file_path), file_path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            return
+
+        data = _config_cache.get(cache_key)
+        if data is None:
+            raw = file_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            _config_cache[cache_key] = data
+        self._data = dict(data)
+        self._dirty = False
+        logger.info(f"Loaded config from {file_path}")
+
+    @property
+    def data(self) -> dict:
+        """Configuration values, loading the file on first access"""
+        if self._pending_load:
+            self._pending_load = False
+            self.load()
+        return self._data
 
     def get(self, key: str, default=None):
         """Get configuration value"""
-        return self._data.get(key, default)
+        return self.data.get(key, default)
+
+    def set(self, key: str, value, persist: bool = True):
+        """Set configuration value
 
-    def set(self, key: str, value):
-        """Set configuration value"""
-        self._data[key] = value
+        With persist=False the value is kept in memory only and does not by
+        itself cause the file to be written on exit.
+        """
+        self.data[key] = value
+        if persist:
+            self._dirty = True
 
     def save(self):
-        """Save configuration to file"""
+        """Save configuration to file if it has changed"""
+        if not self._dirty:
+            return
+
         file_path = Path(self.config_file)
-        with open(file_path, 'w') as f:
-            json.dump(self._data, f, indent=2)
+        if orjson is not None:
+            file_path.write_bytes(orjson.dumps(self._data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(self._data, f, indent=2)
+        self._dirty = False
         logger.info(f"Saved config to {file_path}")
 
 
@@ -90,78 +163,101 @@ pass_config = click.make_pass_decorator(Config, ensure=True)
 
 
 # Main CLI group
-@click.group(chain=True)
+@click.group()
 @click.option('--debug', is_flag=True, help='Enable debug mode')
-@click.option('--config', type=click.Path(), default='config.json',
+@click.option('--config-file', type=click.Path(), default='config.json',
               help='Configuration file')
 @click.option('--log-level',
-              type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR']),
+              type=click.Choice(LOG_LEVELS),
               default='INFO',
               help='Logging level')
 @click.version_option(version='2.0.0')
 @pass_config
-def cli(config: Config, debug: bool, config: str, log_level: str):
+def cli(config: Config, debug: bool, config_file: str, log_level: str):
     """
     Advanced CLI with chaining and plugin support.
 
-    Commands can be chained together:
-        cli init process deploy
-        cli config set key=value process --validate
+    Pipeline steps can be chained together:
+
+    \b
+        cli run init process deploy staging
+        cli run process --validate deploy --dry-run prod
     """
     config.debug = debug
     config.log_level = log_level
-    config.config_file = config
-    config.load()
+    config.config_file = config_file
+    # Read the file only once a command actually uses the config
+    config._pending_load = True
+
+    # Write pending changes once, when the whole invocation finishes
+    click.get_current_context().call_on_close(config.save)
 
     # Set logging level
     logger.setLevel(getattr(logging, log_level))
 
     if debug:
-        console.print("[dim]Debug mode enabled[/dim]")
+        get_console().print("[dim]Debug mode enabled[/dim]")
 
 
-# Pipeline commands (chainable)
-@cli.command()
-@click.option('--template', type=click.Choice(['basic', 'advanced', 'api']),
+# Click cannot nest groups inside a chained group, so the chainable steps
+# live in their own group instead of on cli itself
+@cli.group(chain=True)
+def run():
+    """Run pipeline steps in order"""
+    pass
+
+
+@run.result_callback()
+@pass_config
+def pipeline_summary(config: Config, results: list, **kwargs):
+    """Receive the (step, payload) results of a chained invocation"""
+    steps = [result[0] for result in results if isinstance(result, tuple)]
+    if steps and config.debug:
+        get_console().print(f"[dim]Pipeline: {' -> '.join(steps)}[/dim]")
+
+
+# Pipeline commands (chainable, each returns a (step, payload) tuple)
+@run.command()
+@click.option('--template', type=click.Choice(TEMPLATES),
               default='basic')
 @pass_config
 def init(config: Config, template: str):
     """Initialize project (chainable)"""
-    console.print(f"[cyan]Initializing with {template} template...[/cyan]")
-    config.set('template', template)
-    return config
+    get_console().print(f"[cyan]Initializing with {template} template...[/cyan]")
+    config.set('template', template, persist=False)
+    return ('init', template)
 
 
-@cli.command()
+@run.command()
 @click.option('--validate', is_flag=True, help='Validate before processing')
 @click.option('--parallel', is_flag=True, help='Process in parallel')
 @pass_config
 def process(config: Config, validate: bool, parallel: bool):
     """Process data (chainable)"""
-    console.print("[cyan]Processing data...[/cyan]")
+    get_console().print("[cyan]Processing data...[/cyan]")
 
     if validate:
-        console.print("[dim]Validating input...[/dim]")
+        get_console().print("[dim]Validating input...[/dim]")
 
     mode = "parallel" if parallel else "sequential"
-    console.print(f"[dim]Processing mode: {mode}[/dim]")
+    get_console().print(f"[dim]Processing mode: {mode}[/dim]")
 
-    return config
+    return ('process', mode)
 
 
-@cli.command()
-@click.argument('environment', type=click.Choice(['dev', 'staging', 'prod']))
+@run.command()
+@click.argument('environment', type=click.Choice(ENVIRONMENTS))
 @click.option('--dry-run', is_flag=True, help='Simulate deployment')
 @pass_config
 def deploy(config: Config, environment: str, dry_run: bool):
     """Deploy to environment (chainable)"""
     prefix = "[yellow][DRY RUN][/yellow] " if dry_run else ""
-    console.print(f"{prefix}[cyan]Deploying to {environment}...[/cyan]")
+    get_console().print(f"{prefix}[cyan]Deploying to {environment}...[/cyan]")
 
     template = config.get('template', 'unknown')
-    console.print(f"[dim]Template: {template}[/dim]")
+    get_console().print(f"[dim]Template: {template}[/dim]")
 
-    return config
+    return ('deploy', environment)
 
 
 # Advanced configuration commands
@@ -178,9 +274,9 @@ def get(config: Config, key: str):
     """Get configuration value"""
     value = config.get(key)
     if value is not None:
-        console.print(f"{key}: [green]{value}[/green]")
+        get_console().print(f"{key}: [green]{value}[/green]")
     else:
-        console.print(f"[yellow]Key not found: {key}[/yellow]")
+        get_console().print(f"[yellow]Key not found: {key}[/yellow]")
 
 
 @config.command()
@@ -193,27 +289,26 @@ def set(config: Config, pair: str):
 
     key, value = pair.split('=', 1)
     config.set(key, value)
-    config.save()
-    console.print(f"[green]✓[/green] Set {key} = {value}")
+    get_console().print(f"[green]✓[/green] Set {key} = {value}")
 
 
 @config.command()
-@click.option('--format', type=click.Choice(['json', 'yaml', 'env']),
+@click.option('--format', type=click.Choice(EXPORT_FORMATS),
               default='json')
 @pass_config
 def export(config: Config, format: str):
     """Export configuration in different formats"""
-    console.print(f"[cyan]Exporting config as {format}...[/cyan]")
+    get_console().print(f"[cyan]Exporting config as {format}...[/cyan]")
 
     if format == 'json':
-        output = json.dumps(config._data, indent=2)
+        output = json.dumps(config.data, indent=2)
     elif format == 'yaml':
         # Simplified YAML output
-        output = '\n'.join(f"{k}: {v}" for k, v in config._data.items())
+        output = '\n'.join(f"{k}: {v}" for k, v in config.data.items())
     else:  # env
-        output = '\n'.join(f"{k.upper()}={v}" for k, v in config._data.items())
+        output = '\n'.join(f"{k.upper()}={v}" for k, v in config.data.items())
 
-    console.print(output)
+    get_console().print(output)
 
 
 # Advanced data operations
@@ -229,35 +324,35 @@ def data():
 @pass_config
 def import_data(config: Config, json_data: Optional[dict], paths: Optional[list]):
     """Import data from various sources"""
-    console.print("[cyan]Importing data...[/cyan]")
+    get_console().print("[cyan]Importing data...[/cyan]")
 
     if json_data:
-        console.print(f"[dim]JSON data: {json_data}[/dim]")
+        get_console().print(f"[dim]JSON data: {json_data}[/dim]")
 
     if paths:
-        console.print(f"[dim]Processing {len(paths)} path(s)[/dim]")
+        get_console().print(f"[dim]Processing {len(paths)} path(s)[/dim]")
         for path in paths:
-            console.print(f"  - {path}")
+            get_console().print(f"  - {path}")
 
 
 @data.command()
 @click.option('--input', type=click.File('r'), help='Input file')
 @click.option('--output', type=click.File('w'), help='Output file')
 @click.option('--format',
-              type=click.Choice(['json', 'csv', 'xml']),
+              type=click.Choice(DATA_FORMATS),
               default='json')
 def transform(input, output, format):
     """Transform data between formats"""
-    console.print(f"[cyan]Transforming data to {format}...[/cyan]")
+    get_console().print(f"[cyan]Transforming data to {format}...[/cyan]")
 
     if input:
         data = input.read()
-        console.print(f"[dim]Read {len(data)} bytes[/dim]")
+        get_console().print(f"[dim]Read {len(data)} bytes[/dim]")
 
     if output:
         # Would write transformed data here
         output.write('{}')  # Placeholder
-        console.print("[green]✓[/green] Transformation complete")
+        get_console().print("[green]✓[/green] Transformation complete")
 
 
 # Plugin system
@@ -273,14 +368,14 @@ def plugin():
 def install(plugin_name: str, version: Optional[str]):
     """Install a plugin"""
     version_str = f"@{version}" if version else "@latest"
-    console.print(f"[cyan]Installing plugin: {plugin_name}{version_str}...[/cyan]")
-    console.print("[green]✓[/green] Plugin installed successfully")
+    get_console().print(f"[cyan]Installing plugin: {plugin_name}{version_str}...[/cyan]")
+    get_console().print("[green]✓[/green] Plugin installed successfully")
 
 
 @plugin.command()
 def list():
     """List installed plugins"""
-    console.print("[cyan]Installed Plugins:[/cyan]")
+    get_console().print("[cyan]Installed Plugins:[/cyan]")
     # Placeholder plugin list
     plugins = [
         {"name": "auth-plugin", "version": "1.0.0", "status": "active"},
@@ -288,7 +383,7 @@ def list():
     ]
     for p in plugins:
         status_color = "green" if p["status"] == "active" else "yellow"
-        console.print(f"  - {p['name']} ({p['version']}) [{status_color}]{p['status']}[/{status_color}]")
+        get_console().print(f"  - {p['name']} ({p['version']}) [{status_color}]{p['status']}[/{status_color}]")
 
 
 # Batch operations
@@ -297,13 +392,13 @@ def list():
 @pass_config
 def batch(config: Config, commands: tuple):
     """Execute multiple commands in batch"""
-    console.print(f"[cyan]Executing {len(commands)} command(s)...[/cyan]")
+    get_console().print(f"[cyan]Executing {len(commands)} command(s)...[/cyan]")
 
     for i, cmd in enumerate(commands, 1):
-        console.print(f"[dim]{i}. {cmd}[/dim]")
+        get_console().print(f"[dim]{i}. {cmd}[/dim]")
         # Would execute actual commands here
 
-    console.print("[green]✓[/green] Batch execution completed")
+    get_console().print("[green]✓[/green] Batch execution completed")
 
 
 if __name__ == '__main__':
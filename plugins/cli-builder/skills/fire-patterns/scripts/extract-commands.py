@@ -4,54 +4,100 @@
 import ast
 import sys
 import json
+import math
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional
 
-
-class CommandExtractor:
+try:
+    import orjson
+except ImportError:  # optional: faster JSON export when installed
+    orjson = None
+
+# Google-style docstring sections and "name: help" / "name (type): help" lines
+DOC_SECTION_PATTERN = re.compile(r'^[ \t]*(Args|Returns|Raises):.*$', re.MULTILINE)
+ARG_LINE_PATTERN = re.compile(
+    r'^[ \t]*(\w+)(?:[ \t]*\([^)\n]*\))?[ \t]*:[ \t]*(.*?)[ \t]*$', re.MULTILINE
+)
+
+
+def _unparse(node: ast.AST) -> str:
+    """ast.unparse with a fast path for literals, names and dotted names
+
+    Anything the fast path would render differently (u'' strings, infinite
+    floats, attributes of literals or expressions) goes through ast.unparse.
+    """
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if node.kind is None and (
+            isinstance(value, (str, int, type(None)))
+            or (isinstance(value, float) and math.isfinite(value))
+        ):
+            return repr(value)
+    elif isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Attribute) and isinstance(node.value, (ast.Name, ast.Attribute)):
+        return f"{_unparse(node.value)}.{node.attr}"
+    return ast.unparse(node)
+
+
+@lru_cache(maxsize=512)
+def _parse_cached(path: str, mtime_ns: int) -> ast.Module:
+    """Parse a source file once per (path, modification time)"""
+    return ast.parse(Path(path).read_text())
+
+
+class CommandExtractor(ast.NodeVisitor):
     """Extract command structure from Fire CLI Python files"""
 
     def __init__(self, filepath: Path):
         self.filepath = filepath
         self.tree = None
         self.commands = []
+        self._class_path = []
 
     def extract(self) -> List[Dict]:
         """Extract all commands from Fire CLI"""
         try:
-            content = self.filepath.read_text()
-            self.tree = ast.parse(content)
+            self.tree = _parse_cached(str(self.filepath), self.filepath.stat().st_mtime_ns)
         except Exception as e:
             print(f"Error parsing file: {e}", file=sys.stderr)
             return []
 
-        # Find all classes
-        for node in self.tree.body:
-            if isinstance(node, ast.ClassDef):
-                self._extract_from_class(node)
+        # Single pass over the tree: classes (and nested classes) become
+        # command groups, their public methods become commands
+        self.visit(self.tree)
 
         return self.commands
 
-    def _extract_from_class(self, class_node: ast.ClassDef, parent_path: str = ""):
-        """Extract commands from a class"""
-        class_name = class_node.name
-        class_doc = ast.get_docstring(class_node) or ""
-
-        current_path = f"{parent_path}.{class_name}" if parent_path else class_name
-
-        for item in class_node.body:
-            if isinstance(item, ast.FunctionDef):
-                # Skip private methods
-                if item.name.startswith('_'):
-                    continue
-
-                command = self._extract_command(item, current_path)
-                if command:
-                    self.commands.append(command)
-
-            elif isinstance(item, ast.ClassDef):
-                # Nested class - recurse
-                self._extract_from_class(item, current_path)
+    def visit_Module(self, node: ast.Module):
+        """Only module-level classes are command groups"""
+        for item in node.body:
+            if isinstance(item, ast.ClassDef):
+                self.visit(item)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        """Track the dotted class path while visiting a class body"""
+        self._class_path.append(node.name)
+        # Only methods and nested classes directly in the body count
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.ClassDef)):
+                self.visit(item)
+        self._class_path.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        """Record public methods; function bodies are not searched"""
+        # Module-level functions and private methods are not commands
+        if not self._class_path or node.name.startswith('_'):
+            return
+
+        command = self._extract_command(node, '.'.join(self._class_path))
+        if command:
+            self.commands.append(command)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        """Async methods are not commands; their bodies are not searched"""
 
     def _extract_command(self, func_node: ast.FunctionDef, class_path: str) -> Optional[Dict]:
         """Extract command information from function"""
@@ -63,32 +109,24 @@ class CommandExtractor:
         args_help = {}
 
         if docstring:
-            lines = docstring.split('\n')
-            desc_lines = []
-            in_args = False
-
-            for line in lines:
-                line = line.strip()
-                if line.startswith('Args:'):
-                    in_args = True
-                    continue
-                elif line.startswith('Returns:') or line.startswith('Raises:'):
-                    in_args = False
-                    continue
-
-                if not in_args and line:
-                    desc_lines.append(line)
-                elif in_args and line:
-                    # Parse arg line: "arg_name: description"
-                    if ':' in line:
-                        arg_name, arg_desc = line.split(':', 1)
-                        args_help[arg_name.strip()] = arg_desc.strip()
-
-            description = ' '.join(desc_lines)
+            # Split into [description, header, body, header, body, ...];
+            # Returns/Raises text stays part of the description
+            parts = DOC_SECTION_PATTERN.split(docstring)
+            desc_parts = [parts[0]]
+            for header, body in zip(parts[1::2], parts[2::2]):
+                if header == 'Args':
+                    args_help.update(ARG_LINE_PATTERN.findall(body))
+                else:
+                    desc_parts.append(body)
+
+            description = ' '.join(
+                filter(None, map(str.strip, '\n'.join(desc_parts).splitlines()))
+            )
 
         # Extract arguments
         args = []
-        for arg in func_node.args.args:
+        defaults_offset = len(func_node.args.args) - len(func_node.args.defaults)
+        for arg_index, arg in enumerate(func_node.args.args):
             if arg.arg == 'self':
                 continue
 
@@ -99,8 +137,6 @@ class CommandExtractor:
             }
 
             # Check for default value
-            defaults_offset = len(func_node.args.args) - len(func_node.args.defaults)
-            arg_index = func_node.args.args.index(arg)
             if arg_index >= defaults_offset:
                 default_index = arg_index - defaults_offset
                 default_value = self._get_default_value(func_node.args.defaults[default_index])
@@ -121,64 +157,84 @@ class CommandExtractor:
     def _get_type_annotation(self, arg: ast.arg) -> Optional[str]:
         """Extract type annotation from argument"""
         if arg.annotation:
-            return ast.unparse(arg.annotation)
+            return _unparse(arg.annotation)
         return None
 
     def _get_default_value(self, node) -> str:
         """Extract default value from AST node"""
         try:
-            return ast.unparse(node)
+            return _unparse(node)
         except:
             return repr(node)
 
+    @staticmethod
+    def _tree_section(cmd: Dict) -> str:
+        """Render one command for the tree view"""
+        section = f"📌 {cmd['path']}\n"
+        if cmd['description']:
+            section += f"   {cmd['description']}\n"
+        if cmd['arguments']:
+            section += "   Arguments:\n"
+            for arg in cmd['arguments']:
+                required = "required" if arg['required'] else "optional"
+                type_str = f": {arg['type']}" if arg['type'] else ""
+                default_str = f" = {arg['default']}" if 'default' in arg else ""
+                help_str = f" - {arg['help']}" if arg['help'] else ""
+                section += f"     • {arg['name']}{type_str}{default_str} ({required}){help_str}\n"
+        return section
+
+    def export_tree(self) -> str:
+        """Export commands as a human-readable tree"""
+        header = f"\n{'='*60}\nFire CLI Commands: {self.filepath.name}\n{'='*60}\n"
+        return '\n'.join([header, *map(self._tree_section, self.commands)])
+
     def print_tree(self):
         """Print command tree in human-readable format"""
-        print(f"\n{'='*60}")
-        print(f"Fire CLI Commands: {self.filepath.name}")
-        print(f"{'='*60}\n")
-
-        for cmd in self.commands:
-            print(f"📌 {cmd['path']}")
-            if cmd['description']:
-                print(f"   {cmd['description']}")
-            if cmd['arguments']:
-                print(f"   Arguments:")
-                for arg in cmd['arguments']:
-                    required = "required" if arg['required'] else "optional"
-                    type_str = f": {arg['type']}" if arg['type'] else ""
-                    default_str = f" = {arg['default']}" if 'default' in arg else ""
-                    help_str = f" - {arg['help']}" if arg['help'] else ""
-                    print(f"     • {arg['name']}{type_str}{default_str} ({required}){help_str}")
-            print()
+        print(self.export_tree())
 
     def export_json(self) -> str:
         """Export commands as JSON"""
-        return json.dumps(self.commands, indent=2)
+        if orjson is not None:
+            return orjson.dumps(self.commands, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(self.commands, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    def _markdown_section(cmd: Dict) -> str:
+        """Render one command as a Markdown section"""
+        section = f"## `{cmd['path']}`\n\n"
+        if cmd['description']:
+            section += f"{cmd['description']}\n\n"
+        if cmd['arguments']:
+            section += "### Arguments\n\n"
+            for arg in cmd['arguments']:
+                required = "**required**" if arg['required'] else "*optional*"
+                type_str = f" (`{arg['type']}`)" if arg['type'] else ""
+                default_str = f" Default: `{arg['default']}`" if 'default' in arg else ""
+                section += f"- `{arg['name']}`{type_str} - {required}{default_str}\n"
+                if arg['help']:
+                    section += f"  - {arg['help']}\n"
+        return section
 
     def export_markdown(self) -> str:
         """Export commands as Markdown"""
-        lines = [f"# {self.filepath.name} Commands\n"]
-
-        for cmd in self.commands:
-            lines.append(f"## `{cmd['path']}`\n")
+        header = f"# {self.filepath.name} Commands\n"
+        return '\n'.join([header, *map(self._markdown_section, self.commands)])
 
-            if cmd['description']:
-                lines.append(f"{cmd['description']}\n")
 
-            if cmd['arguments']:
-                lines.append("### Arguments\n")
-                for arg in cmd['arguments']:
-                    required = "**required**" if arg['required'] else "*optional*"
-                    type_str = f" (`{arg['type']}`)" if arg['type'] else ""
-                    default_str = f" Default: `{arg['default']}`" if 'default' in arg else ""
+def run(filepath: Path, output_format: str = 'tree') -> str:
+    """Extract commands from a Fire CLI file and return them formatted
 
-                    lines.append(f"- `{arg['name']}`{type_str} - {required}{default_str}")
-                    if arg['help']:
-                        lines.append(f"  - {arg['help']}")
-
-            lines.append("")
+    Library entry point: call this in-process instead of spawning the script.
+    output_format is one of 'tree', 'json' or 'markdown'.
+    """
+    extractor = CommandExtractor(filepath)
+    extractor.extract()
 
-        return '\n'.join(lines)
+    if output_format == 'json':
+        return extractor.export_json()
+    elif output_format == 'markdown':
+        return extractor.export_markdown()
+    return extractor.export_tree()
 
 
 def main():
@@ -187,21 +243,13 @@ def main():
         sys.exit(1)
 
     filepath = Path(sys.argv[1])
-    output_format = sys.argv[2] if len(sys.argv) > 2 else '--tree'
+    output_format = sys.argv[2].lstrip('-') if len(sys.argv) > 2 else 'tree'
 
     if not filepath.exists():
         print(f"Error: File not found: {filepath}", file=sys.stderr)
         sys.exit(1)
 
-    extractor = CommandExtractor(filepath)
-    extractor.extract()
-
-    if output_format == '--json':
-        print(extractor.export_json())
-    elif output_format == '--markdown':
-        print(extractor.export_markdown())
-    else:
-        extractor.print_tree()
+    print(run(filepath, output_format))
 
 
 if __name__ == '__main__':
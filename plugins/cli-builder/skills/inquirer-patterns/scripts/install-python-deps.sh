@@ -47,6 +47,10 @@ pip3 install "prompt_toolkit>=3.0.0"
 echo "📥 Installing colorama (optional, for Windows support)..."
 pip3 install colorama
 
+# Optional: Install rapidfuzz for typo-tolerant autocomplete
+echo "📥 Installing rapidfuzz (optional, for fuzzy autocomplete)..."
+pip3 install rapidfuzz
+
 echo
 echo "✅ All Python dependencies installed successfully!"
 echo
@@ -54,6 +58,7 @@ echo "📚 Installed packages:"
 echo "  - questionary>=2.0.0"
 echo "  - prompt_toolkit>=3.0.0"
 echo "  - colorama"
+echo "  - rapidfuzz"
 echo
 echo "🚀 You can now run the examples:"
 echo "  python3 templates/python/text_prompt.py"
@@ -5,12 +5,218 @@ Use for: Large option lists with search
 Features: Type-ahead, fuzzy matching, suggestions
 """
 
+import json
+import sys
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+
 import questionary
 from questionary import Choice
+from prompt_toolkit.completion import Completer, Completion
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional: typo-tolerant fallback when nothing matches
+    process = None
+
+FUZZY_LIMIT = 20
+FUZZY_SCORE_CUTOFF = 60
+
+# Encoder built once and reused for every summary printout
+JSON_ENCODE = json.JSONEncoder(indent=2).encode
+
+
+class Dawg:
+    """Directed acyclic word graph shared by several choice lists
+
+    Keys are inserted into a trie, then identical subtrees are merged so
+    common suffixes ("stan", "ia", ...) are stored once. Each terminal keeps
+    a bitmask of the lists containing its key; display strings live in a
+    side table, so lookups return text exactly as it was inserted.
+    """
+
+    _END = object()
+
+    def __init__(self, sources):
+        """Build from (bit, {display: key}) pairs, one per choice list"""
+        root = {}
+        self.displays = {}
+        for bit, values in sources:
+            for display, key in values.items():
+                key = key.lower()
+                node = root
+                for char in key:
+                    node = node.setdefault(char, {})
+                node[self._END] = node.get(self._END, 0) | bit
+                self.displays.setdefault(key, []).append((bit, display))
+        self.root = self._merge(root, {})
+
+    def _merge(self, node, registry):
+        """Replace node's subtrees with shared copies, post-order"""
+        for char, child in node.items():
+            if char is not self._END:
+                node[char] = self._merge(child, registry)
+        signature = (
+            node.get(self._END, 0),
+            tuple(sorted((char, id(child)) for char, child in node.items()
+                         if char is not self._END))
+        )
+        return registry.setdefault(signature, node)
+
+    def starts_with(self, prefix, sources=-1):
+        """Return display strings from `sources` whose key starts with prefix"""
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+
+        matches = []
+        # Nodes are shared, so each stack entry carries the key spelled so far
+        stack = [(node, prefix)]
+        while stack:
+            node, key = stack.pop()
+            if node.get(self._END, 0) & sources:
+                matches.extend(display for bit, display in self.displays[key]
+                               if bit & sources)
+            children = sorted((char for char in node if char is not self._END),
+                              reverse=True)
+            stack.extend((node[char], key + char) for char in children)
+        return matches
+
+
+class DawgView:
+    """One choice list's slice of a shared Dawg, usable as a completer index"""
+
+    def __init__(self, dawg, source, values):
+        self.dawg = dawg
+        self.source = source
+        self.key_of = {display: key.lower() for display, key in values.items()}
+
+    def starts_with(self, prefix):
+        return self.dawg.starts_with(prefix, self.source)
+
+
+class SortedPrefixIndex:
+    """Sorted lowercase keys for prefix lookups with bisect
+
+    Matches for a prefix form one contiguous slice of the sorted keys, so a
+    lookup is two binary searches plus the slice.
+    """
+
+    def __init__(self, words):
+        self.originals = sorted(words, key=str.lower)
+        self.keys = [word.lower() for word in self.originals]
+        self.key_of = dict(zip(self.originals, self.keys))
+
+    def starts_with(self, prefix):
+        """Return words whose lowercase form starts with a lowercase prefix"""
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + '\uffff', start)
+        return self.originals[start:end]
+
+
+class TrigramIndex:
+    """Three-character windows of each key, for substring lookups
+
+    A query's trigrams are intersected to get a few candidates, which are
+    then confirmed with a plain `in` check ("zim" -> Zimbabwe).
+    """
+
+    def __init__(self, values):
+        """Build from a {display: key} mapping"""
+        self.displays = list(values)
+        self.keys = [key.lower() for key in values.values()]
+        self.postings = defaultdict(set)
+        for position, key in enumerate(self.keys):
+            for start in range(len(key) - 2):
+                self.postings[key[start:start + 3]].add(position)
+
+    def find(self, query):
+        """Return displays whose key contains a lowercase query (3+ chars)"""
+        if len(query) < 3:
+            return []
+        postings = [self.postings.get(query[start:start + 3])
+                    for start in range(len(query) - 2)]
+        if not all(postings):
+            return []
+        candidates = set.intersection(*postings)
+        return [self.displays[position] for position in sorted(candidates)
+                if query in self.keys[position]]
+
+
+class PrefixSessionCache:
+    """Narrow the previous keystroke's matches while the user keeps typing
+
+    Matches for "unit" are a subset of matches for "uni", so when the new
+    prefix extends the last one only the last results are re-checked.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self._last_prefix = None
+        self._last_results = []
+
+    def get(self, prefix):
+        """Return matches for a lowercase prefix"""
+        if self._last_prefix is not None and prefix.startswith(self._last_prefix):
+            key_of = self.index.key_of
+            results = [word for word in self._last_results
+                       if key_of[word].startswith(prefix)]
+        else:
+            results = self.index.starts_with(prefix)
+
+        self._last_prefix = prefix
+        self._last_results = results
+        return results
+
+
+class PrefixCompleter(Completer):
+    """prompt_toolkit completer backed by a DawgView or SortedPrefixIndex
+
+    Lookups are memoized per lowercase prefix, so typing over a prefix again
+    (e.g. after backspace) is a dict hit. The choice lists are constants,
+    so cached results never need invalidating. When no choice starts with
+    the prefix, an optional TrigramIndex is searched for substring matches;
+    failing that, if rapidfuzz is installed, the closest keys are suggested
+    ("untied" -> "United States").
+    """
+
+    def __init__(self, index, substrings=None, cache_size=256):
+        self.index = index
+        self.substrings = substrings
+        self.session = PrefixSessionCache(index)
+        self.lookup = lru_cache(maxsize=cache_size)(self._lookup)
+
+    def _lookup(self, prefix):
+        matches = self.session.get(prefix)
+        if not matches and self.substrings is not None:
+            matches = self.substrings.find(prefix)
+        if not matches and prefix and process is not None:
+            # With a dict of choices, extract() yields (key, score, display)
+            matches = [
+                display for _, _, display in process.extract(
+                    prefix, self.index.key_of, scorer=fuzz.WRatio,
+                    limit=FUZZY_LIMIT, score_cutoff=FUZZY_SCORE_CUTOFF
+                )
+            ]
+        return tuple(matches)
+
+    def get_completions(self, document, complete_event):
+        text = document.text_before_cursor
+        for match in self.lookup(text.lower()):
+            yield Completion(match, start_position=-len(text))
+
+
+def choice_tuple(*choices):
+    """Freeze choices into a tuple of interned strings, built once at import"""
+    return tuple(map(sys.intern, choices))
 
 
 # Example: Countries list for autocomplete
-COUNTRIES = [
+COUNTRIES = choice_tuple(
     'Afghanistan', 'Albania', 'Algeria', 'Andorra', 'Angola',
     'Argentina', 'Armenia', 'Australia', 'Austria', 'Azerbaijan',
     'Bahamas', 'Bahrain', 'Bangladesh', 'Barbados', 'Belarus',
@@ -42,10 +248,19 @@ COUNTRIES = [
     'Tunisia', 'Turkey', 'Uganda', 'Ukraine', 'United Arab Emirates',
     'United Kingdom', 'United States', 'Uruguay', 'Uzbekistan',
     'Venezuela', 'Vietnam', 'Yemen', 'Zambia', 'Zimbabwe'
-]
+)
+
+# Example: Cities for a few countries (read-only, keys interned like COUNTRIES)
+CITIES_BY_COUNTRY = MappingProxyType({
+    sys.intern('United States'): choice_tuple('New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix'),
+    sys.intern('United Kingdom'): choice_tuple('London', 'Manchester', 'Birmingham', 'Glasgow', 'Liverpool'),
+    sys.intern('Canada'): choice_tuple('Toronto', 'Vancouver', 'Montreal', 'Calgary', 'Ottawa'),
+    sys.intern('Australia'): choice_tuple('Sydney', 'Melbourne', 'Brisbane', 'Perth', 'Adelaide'),
+    sys.intern('Germany'): choice_tuple('Berlin', 'Munich', 'Hamburg', 'Frankfurt', 'Cologne')
+})
 
 # Example: Popular packages
-POPULAR_PACKAGES = [
+POPULAR_PACKAGES = choice_tuple(
     'express', 'react', 'vue', 'angular', 'next', 'nuxt',
     'axios', 'lodash', 'moment', 'dayjs', 'uuid', 'dotenv',
     'typescript', 'eslint', 'prettier', 'jest', 'mocha', 'chai',
@@ -54,7 +269,164 @@ POPULAR_PACKAGES = [
     'prisma', 'typeorm', 'knex', 'pg', 'mysql2',
     'bcrypt', 'jsonwebtoken', 'passport', 'helmet', 'cors',
     'multer', 'sharp', 'puppeteer', 'playwright', 'cheerio'
-]
+)
+
+# Example: Frameworks with descriptions
+FRAMEWORKS = choice_tuple(
+    'React - UI library by Facebook',
+    'Vue.js - Progressive JavaScript framework',
+    'Angular - Platform for building web apps',
+    'Svelte - Cybernetically enhanced web apps',
+    'Next.js - React framework with SSR',
+    'Nuxt.js - Vue.js framework with SSR',
+    'Remix - Full stack web framework',
+    'SvelteKit - Svelte framework',
+    'Express - Fast Node.js web framework',
+    'Fastify - Fast and low overhead web framework',
+    'NestJS - Progressive Node.js framework',
+    'Koa - Expressive middleware for Node.js'
+)
+
+# Example: Commands with emojis and descriptions
+COMMANDS = choice_tuple(
+    '📦 install - Install dependencies',
+    '🚀 start - Start development server',
+    '🏗️  build - Build for production',
+    '🧪 test - Run tests',
+    '🔍 lint - Check code quality',
+    '✨ format - Format code',
+    '📝 generate - Generate files',
+    '🔄 update - Update dependencies',
+    '🧹 clean - Clean build artifacts',
+    '🚢 deploy - Deploy application',
+    '📊 analyze - Analyze bundle size',
+    '🐛 debug - Start debugger'
+)
+
+# Example: API endpoints with descriptions
+ENDPOINTS = choice_tuple(
+    'GET /users - List all users',
+    'GET /users/:id - Get user by ID',
+    'POST /users - Create new user',
+    'PUT /users/:id - Update user',
+    'DELETE /users/:id - Delete user',
+    'GET /posts - List all posts',
+    'GET /posts/:id - Get post by ID',
+    'POST /posts - Create new post',
+    'GET /comments - List comments',
+    'POST /auth/login - User login',
+    'POST /auth/register - User registration',
+    'POST /auth/logout - User logout'
+)
+
+# Technology stack choices
+LANGUAGES = choice_tuple(
+    'JavaScript', 'TypeScript', 'Python', 'Go', 'Rust',
+    'Java', 'C++', 'Ruby', 'PHP', 'Swift', 'Kotlin'
+)
+
+FRAMEWORKS_BY_LANGUAGE = {
+    'JavaScript': choice_tuple('React', 'Vue', 'Angular', 'Svelte', 'Express', 'Fastify'),
+    'TypeScript': choice_tuple('Next.js', 'Nest.js', 'Angular', 'Remix', 'tRPC'),
+    'Python': choice_tuple('Django', 'Flask', 'FastAPI', 'Tornado', 'Sanic'),
+    'Go': choice_tuple('Gin', 'Echo', 'Fiber', 'Chi', 'Gorilla'),
+    'Rust': choice_tuple('Actix', 'Rocket', 'Axum', 'Warp', 'Tide'),
+    'Java': choice_tuple('Spring', 'Micronaut', 'Quarkus', 'Vert.x'),
+    'Ruby': choice_tuple('Ruby on Rails', 'Sinatra', 'Hanami')
+}
+
+DATABASES = choice_tuple(
+    'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'SQLite',
+    'Cassandra', 'DynamoDB', 'CouchDB', 'Neo4j', 'InfluxDB'
+)
+
+CLOUD_PROVIDERS = choice_tuple(
+    'AWS', 'Google Cloud', 'Azure', 'DigitalOcean',
+    'Heroku', 'Vercel', 'Netlify', 'Cloudflare'
+)
+
+# File path examples
+DIRECTORIES = choice_tuple(
+    '/home/user/projects/web-app',
+    '/home/user/projects/api-server',
+    '/home/user/projects/cli-tool',
+    '/var/www/html',
+    '/opt/applications',
+    '~/Documents/code',
+    '~/workspace/nodejs',
+    '~/workspace/python'
+)
+
+CONFIG_FILES = choice_tuple(
+    'package.json',
+    'tsconfig.json',
+    'jest.config.js',
+    'webpack.config.js',
+    '.env',
+    '.gitignore',
+    'README.md',
+    'Dockerfile',
+    'docker-compose.yml'
+)
+
+# Display string -> value, parsed once here rather than after every prompt
+FRAMEWORK_VALUES = {s: s.split(' - ', 1)[0] for s in FRAMEWORKS}
+ENDPOINT_VALUES = {s: s.split(' - ', 1)[0] for s in ENDPOINTS}
+# Commands drop the leading emoji as well ("📦 install - ..." -> "install")
+COMMAND_VALUES = {s: s.split(' - ', 1)[0].split(None, 1)[1] for s in COMMANDS}
+
+
+# Display string -> lookup key for each list stored in the shared DAWG
+DAWG_SOURCES = {
+    'countries': {country: country for country in COUNTRIES},
+    'packages': {package: package for package in POPULAR_PACKAGES},
+    'frameworks': FRAMEWORK_VALUES,
+    'commands': COMMAND_VALUES,
+    'endpoints': ENDPOINT_VALUES,
+}
+DAWG_SOURCE_BITS = {name: 1 << i for i, name in enumerate(DAWG_SOURCES)}
+
+
+def build_completers():
+    """Build the DAWG, sorted indexes and completers used by the examples
+
+    Completers are shared by every prompt so their caches persist across
+    calls. Large lists share one DAWG (search all of them by passing
+    sources=-1 to its starts_with); short technology lists use sorted
+    arrays and bisect.
+    """
+    dawg = Dawg(
+        (DAWG_SOURCE_BITS[name], values) for name, values in DAWG_SOURCES.items()
+    )
+    views = {
+        name: DawgView(dawg, DAWG_SOURCE_BITS[name], values)
+        for name, values in DAWG_SOURCES.items()
+    }
+    return {
+        'dawg': dawg,
+        'countries': PrefixCompleter(
+            views['countries'], substrings=TrigramIndex(DAWG_SOURCES['countries'])
+        ),
+        'packages': PrefixCompleter(
+            views['packages'], substrings=TrigramIndex(DAWG_SOURCES['packages'])
+        ),
+        'frameworks': PrefixCompleter(views['frameworks']),
+        'commands': PrefixCompleter(views['commands']),
+        'endpoints': PrefixCompleter(views['endpoints']),
+        'languages': PrefixCompleter(SortedPrefixIndex(LANGUAGES)),
+        'frameworks_by_language': {
+            language: PrefixCompleter(SortedPrefixIndex(frameworks))
+            for language, frameworks in FRAMEWORKS_BY_LANGUAGE.items()
+        },
+        'databases': PrefixCompleter(SortedPrefixIndex(DATABASES)),
+        'cloud_providers': PrefixCompleter(SortedPrefixIndex(CLOUD_PROVIDERS)),
+    }
+
+
+@lru_cache(maxsize=None)
+def completers():
+    """Build the completers on first use and return the same ones afterwards"""
+    return build_completers()
 
 
 def autocomplete_prompt_example():
@@ -66,29 +438,25 @@ def autocomplete_prompt_example():
     country = questionary.autocomplete(
         "Select your country:",
         choices=COUNTRIES,
+        completer=completers()['countries'],
         validate=lambda text: len(text) > 0 or "Please select a country"
     ).ask()
 
     # Package selection
     package = questionary.autocomplete(
         "Search for an npm package:",
-        choices=POPULAR_PACKAGES
+        choices=POPULAR_PACKAGES,
+        completer=completers()['packages']
     ).ask()
 
     # Cities based on country (conditional)
     city = None
-    cities_by_country = {
-        'United States': ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix'],
-        'United Kingdom': ['London', 'Manchester', 'Birmingham', 'Glasgow', 'Liverpool'],
-        'Canada': ['Toronto', 'Vancouver', 'Montreal', 'Calgary', 'Ottawa'],
-        'Australia': ['Sydney', 'Melbourne', 'Brisbane', 'Perth', 'Adelaide'],
-        'Germany': ['Berlin', 'Munich', 'Hamburg', 'Frankfurt', 'Cologne']
-    }
+    cities = CITIES_BY_COUNTRY.get(sys.intern(country)) if country else None
 
-    if country in cities_by_country:
+    if cities is not None:
         city = questionary.autocomplete(
             "Select city:",
-            choices=cities_by_country[country]
+            choices=cities
         ).ask()
 
     answers = {
@@ -98,8 +466,7 @@ def autocomplete_prompt_example():
     }
 
     print("\n✅ Selections:")
-    import json
-    print(json.dumps(answers, indent=2))
+    print(JSON_ENCODE(answers))
 
     return answers
 
@@ -109,28 +476,14 @@ def framework_search_example():
 
     print("\n🔎 Framework Search Example\n")
 
-    frameworks = [
-        'React - UI library by Facebook',
-        'Vue.js - Progressive JavaScript framework',
-        'Angular - Platform for building web apps',
-        'Svelte - Cybernetically enhanced web apps',
-        'Next.js - React framework with SSR',
-        'Nuxt.js - Vue.js framework with SSR',
-        'Remix - Full stack web framework',
-        'SvelteKit - Svelte framework',
-        'Express - Fast Node.js web framework',
-        'Fastify - Fast and low overhead web framework',
-        'NestJS - Progressive Node.js framework',
-        'Koa - Expressive middleware for Node.js'
-    ]
-
     framework = questionary.autocomplete(
         "Search for a framework:",
-        choices=frameworks
+        choices=FRAMEWORKS,
+        completer=completers()['frameworks']
     ).ask()
 
-    # Extract value (remove description)
-    framework_name = framework.split(' - ')[0] if ' - ' in framework else framework
+    # Extract value (remove description); free text is kept as typed
+    framework_name = FRAMEWORK_VALUES.get(framework, framework)
 
     print(f"\n✅ Selected: {framework_name}")
 
@@ -142,28 +495,14 @@ def command_search_example():
 
     print("\n⌨️  Command Search Example\n")
 
-    commands = [
-        '📦 install - Install dependencies',
-        '🚀 start - Start development server',
-        '🏗️  build - Build for production',
-        '🧪 test - Run tests',
-        '🔍 lint - Check code quality',
-        '✨ format - Format code',
-        '📝 generate - Generate files',
-        '🔄 update - Update dependencies',
-        '🧹 clean - Clean build artifacts',
-        '🚢 deploy - Deploy application',
-        '📊 analyze - Analyze bundle size',
-        '🐛 debug - Start debugger'
-    ]
-
     command = questionary.autocomplete(
         "Search for a command:",
-        choices=commands
+        choices=COMMANDS,
+        completer=completers()['commands']
     ).ask()
 
     # Extract command name
-    command_name = command.split(' - ')[0].split(' ', 1)[1] if ' - ' in command else command
+    command_name = COMMAND_VALUES.get(command, command)
 
     print(f"\n✅ Running: {command_name}")
 
@@ -175,28 +514,14 @@ def api_endpoint_search():
 
     print("\n🔍 API Endpoint Search\n")
 
-    endpoints = [
-        'GET /users - List all users',
-        'GET /users/:id - Get user by ID',
-        'POST /users - Create new user',
-        'PUT /users/:id - Update user',
-        'DELETE /users/:id - Delete user',
-        'GET /posts - List all posts',
-        'GET /posts/:id - Get post by ID',
-        'POST /posts - Create new post',
-        'GET /comments - List comments',
-        'POST /auth/login - User login',
-        'POST /auth/register - User registration',
-        'POST /auth/logout - User logout'
-    ]
-
     endpoint = questionary.autocomplete(
         "Search API endpoints:",
-        choices=endpoints
+        choices=ENDPOINTS,
+        completer=completers()['endpoints']
     ).ask()
 
     # Extract endpoint path
-    endpoint_path = endpoint.split(' - ')[0] if ' - ' in endpoint else endpoint
+    endpoint_path = ENDPOINT_VALUES.get(endpoint, endpoint)
 
     print(f"\n✅ Selected endpoint: {endpoint_path}")
 
@@ -209,53 +534,38 @@ def technology_stack_selection():
     print("\n🛠️  Technology Stack Selection\n")
 
     # Programming languages
-    languages = [
-        'JavaScript', 'TypeScript', 'Python', 'Go', 'Rust',
-        'Java', 'C++', 'Ruby', 'PHP', 'Swift', 'Kotlin'
-    ]
-
     language = questionary.autocomplete(
         "Choose programming language:",
-        choices=languages
+        choices=LANGUAGES,
+        completer=completers()['languages']
     ).ask()
 
     # Frameworks based on language
-    frameworks_by_language = {
-        'JavaScript': ['React', 'Vue', 'Angular', 'Svelte', 'Express', 'Fastify'],
-        'TypeScript': ['Next.js', 'Nest.js', 'Angular', 'Remix', 'tRPC'],
-        'Python': ['Django', 'Flask', 'FastAPI', 'Tornado', 'Sanic'],
-        'Go': ['Gin', 'Echo', 'Fiber', 'Chi', 'Gorilla'],
-        'Rust': ['Actix', 'Rocket', 'Axum', 'Warp', 'Tide'],
-        'Java': ['Spring', 'Micronaut', 'Quarkus', 'Vert.x'],
-        'Ruby': ['Ruby on Rails', 'Sinatra', 'Hanami']
-    }
-
-    framework_choices = frameworks_by_language.get(language, ['None'])
-    framework = questionary.autocomplete(
-        f"Choose {language} framework:",
-        choices=framework_choices
-    ).ask()
+    framework_completer = completers()['frameworks_by_language'].get(language)
+    if framework_completer is not None:
+        framework = questionary.autocomplete(
+            f"Choose {language} framework:",
+            choices=framework_completer.index.originals,
+            completer=framework_completer
+        ).ask()
+    else:
+        framework = questionary.autocomplete(
+            f"Choose {language} framework:",
+            choices=['None']
+        ).ask()
 
     # Databases
-    databases = [
-        'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'SQLite',
-        'Cassandra', 'DynamoDB', 'CouchDB', 'Neo4j', 'InfluxDB'
-    ]
-
     database = questionary.autocomplete(
         "Choose database:",
-        choices=databases
+        choices=DATABASES,
+        completer=completers()['databases']
     ).ask()
 
     # Cloud providers
-    cloud_providers = [
-        'AWS', 'Google Cloud', 'Azure', 'DigitalOcean',
-        'Heroku', 'Vercel', 'Netlify', 'Cloudflare'
-    ]
-
     cloud = questionary.autocomplete(
         "Choose cloud provider:",
-        choices=cloud_providers
+        choices=CLOUD_PROVIDERS,
+        completer=completers()['cloud_providers']
     ).ask()
 
     stack = {
@@ -266,8 +576,7 @@ def technology_stack_selection():
     }
 
     print("\n✅ Technology Stack:")
-    import json
-    print(json.dumps(stack, indent=2))
+    print(JSON_ENCODE(stack))
 
     return stack
 
@@ -278,38 +587,15 @@ def file_path_autocomplete():
     print("\n📁 File Path Autocomplete Example\n")
 
     # Common project directories
-    directories = [
-        '/home/user/projects/web-app',
-        '/home/user/projects/api-server',
-        '/home/user/projects/cli-tool',
-        '/var/www/html',
-        '/opt/applications',
-        '~/Documents/code',
-        '~/workspace/nodejs',
-        '~/workspace/python'
-    ]
-
     project_path = questionary.autocomplete(
         "Select project directory:",
-        choices=directories
+        choices=DIRECTORIES
     ).ask()
 
     # Common config files
-    config_files = [
-        'package.json',
-        'tsconfig.json',
-        'jest.config.js',
-        'webpack.config.js',
-        '.env',
-        '.gitignore',
-        'README.md',
-        'Dockerfile',
-        'docker-compose.yml'
-    ]
-
     config_file = questionary.autocomplete(
         "Select config file:",
-        choices=config_files
+        choices=CONFIG_FILES
     ).ask()
 
     result = {
@@ -318,8 +604,7 @@ def file_path_autocomplete():
     }
 
     print("\n✅ Selected:")
-    import json
-    print(json.dumps(result, indent=2))
+    print(JSON_ENCODE(result))
 
     return result
 
@@ -5,10 +5,180 @@ Use for: Dynamic forms based on previous answers
 Features: Skip logic, dependent questions, branching
 """
 
+import json
+import re
+import sys
+from functools import lru_cache
+
 import questionary
 from questionary import Choice, Separator
 
 
+FEATURE_NAME_PATTERN = re.compile(r'^[a-z0-9_-]+$')
+CRON_FIELDS = 5
+
+# Platform-specific choices, built once per process
+AWS_SERVICES = ('ECS', 'EKS', 'Lambda', 'Elastic Beanstalk', 'EC2')
+AUTO_SCALING_SERVICES = frozenset({'ECS', 'EKS'})
+GCP_SERVICES = ('Cloud Run', 'GKE', 'App Engine', 'Compute Engine')
+CDN_PROVIDERS = ('CloudFlare', 'AWS CloudFront', 'Google Cloud CDN', 'Azure CDN')
+TEST_TYPES = ('Unit tests', 'Integration tests', 'E2E tests', 'Performance tests')
+SECURITY_TOOLS = ('Snyk', 'Dependabot', 'SonarQube', 'OWASP Dependency Check')
+
+# Feature flag and CI/CD choices
+ROLLOUT_STRATEGIES = (
+    'All users',
+    'Percentage rollout',
+    'User targeting',
+    'Beta users only',
+    'Manual control'
+)
+USER_GROUPS = (
+    'Beta testers',
+    'Premium users',
+    'Internal team',
+    'Early adopters',
+    'Specific regions'
+)
+TARGET_REGIONS = ('North America', 'Europe', 'Asia Pacific', 'South America', 'Africa')
+FEATURE_METRICS = (
+    'Usage count',
+    'User adoption rate',
+    'Performance impact',
+    'Error rate',
+    'User feedback'
+)
+CI_PROVIDERS = ('GitHub Actions', 'GitLab CI', 'CircleCI', 'Jenkins', 'Travis CI')
+PIPELINE_TRIGGERS = (
+    'Push to main/master',
+    'Pull request',
+    'Tag creation',
+    'Manual trigger',
+    'Scheduled (cron)'
+)
+PIPELINE_STAGES = ('Build', 'Test', 'Lint', 'Security scan', 'Deploy')
+DEPLOY_ENVIRONMENTS = ('Development', 'Staging', 'Production')
+NOTIFICATION_CHANNELS = ('Email', 'Slack', 'Discord', 'Microsoft Teams')
+
+
+@lru_cache(maxsize=None)
+def cached_choices(choices):
+    """Wrap a tuple of strings in Choice objects once and reuse them"""
+    return tuple(Choice(choice) for choice in choices)
+
+
+class WizardConfig:
+    """Wizard answers held in fixed slots instead of a dict grown key by key
+
+    Unanswered fields stay None and are left out of to_dict(), which emits
+    camelCase keys in slot order for the JSON summary.
+    """
+
+    __slots__ = ()
+    JSON_KEYS = {}
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+
+    def to_dict(self):
+        answers = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                head, *rest = name.split('_')
+                key = self.JSON_KEYS.get(name) or head + ''.join(map(str.title, rest))
+                answers[key] = value
+        return answers
+
+
+class DeployConfig(WizardConfig):
+    """Answers collected by deployment_wizard"""
+
+    __slots__ = (
+        'environment', 'use_docker', 'docker_image', 'registry', 'platform',
+        'aws_service', 'auto_scale', 'min_instances', 'max_instances',
+        'gcp_service', 'use_cdn', 'cdn_provider', 'monitoring_tools'
+    )
+    JSON_KEYS = {'use_cdn': 'useCDN'}
+
+
+class PipelineConfig(WizardConfig):
+    """Answers collected by cicd_pipeline_wizard"""
+
+    __slots__ = (
+        'provider', 'triggers', 'cron_schedule', 'stages', 'test_types',
+        'security_tools', 'deploy_environments', 'require_approval',
+        'notification_channels'
+    )
+
+
+def print_json(data):
+    """Stream data to stdout as indented JSON without building the string"""
+    json.dump(data, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+def parse_bounded_int(text, low, high=None):
+    """Return text as an int if it is ASCII digits within [low, high], else None"""
+    # isascii() rules out digits like '²' that pass isdigit() but break int()
+    if not (text.isascii() and text.isdigit()):
+        return None
+    value = int(text)
+    if value < low or (high is not None and value > high):
+        return None
+    return value
+
+
+# Validators are defined once here instead of as lambdas rebuilt per prompt
+def validate_database_name(text):
+    return len(text) > 0 or "Database name required"
+
+
+def validate_username(text):
+    return len(text) > 0 or "Username required"
+
+
+def validate_ssl_cert_path(text):
+    return len(text) > 0 or "SSL certificate path required"
+
+
+def validate_docker_image(text):
+    return len(text) > 0 or "Docker image name required"
+
+
+def validate_min_instances(text):
+    return parse_bounded_int(text, 1) is not None or "Must be at least 1"
+
+
+def validate_monitoring_tools(choices):
+    return len(choices) > 0 or "Select at least one tool"
+
+
+def validate_feature_name(text):
+    return FEATURE_NAME_PATTERN.match(text) is not None or "Use lowercase, hyphens, underscores only"
+
+
+def validate_percentage(text):
+    return parse_bounded_int(text, 0, 100) is not None or "Must be between 0 and 100"
+
+
+def validate_user_groups(choices):
+    return len(choices) > 0 or "Select at least one group"
+
+
+def validate_expiration_date(text):
+    return len(text) == 10 and text.count('-') == 2 or "Use format YYYY-MM-DD"
+
+
+def validate_cron(text):
+    return len(text.split()) == CRON_FIELDS or "Invalid cron format (5 parts required)"
+
+
+def validate_stages(choices):
+    return len(choices) > 0 or "Select at least one stage"
+
+
 def conditional_prompt_example():
     """Example conditional prompts"""
 
@@ -57,7 +227,7 @@ def conditional_prompt_example():
         # Database name
         database_name = questionary.text(
             "Database name:",
-            validate=lambda text: len(text) > 0 or "Database name required"
+            validate=validate_database_name
         ).ask()
 
         database_config['databaseName'] = database_name
@@ -71,7 +241,7 @@ def conditional_prompt_example():
         if use_authentication:
             database_username = questionary.text(
                 "Database username:",
-                validate=lambda text: len(text) > 0 or "Username required"
+                validate=validate_username
             ).ask()
 
             database_password = questionary.password(
@@ -92,7 +262,7 @@ def conditional_prompt_example():
             if use_ssl:
                 ssl_cert_path = questionary.text(
                     "Path to SSL certificate:",
-                    validate=lambda text: len(text) > 0 or "SSL certificate path required"
+                    validate=validate_ssl_cert_path
                 ).ask()
 
                 database_config['useSSL'] = True
@@ -104,8 +274,7 @@ def conditional_prompt_example():
     }
 
     print("\n✅ Configuration:")
-    import json
-    print(json.dumps(answers, indent=2))
+    print_json(answers)
 
     return answers
 
@@ -121,7 +290,7 @@ def deployment_wizard():
         choices=['Development', 'Staging', 'Production']
     ).ask()
 
-    config = {'environment': environment}
+    config = DeployConfig(environment=environment)
 
     # Docker
     use_docker = questionary.confirm(
@@ -129,16 +298,16 @@ def deployment_wizard():
         default=True
     ).ask()
 
-    config['useDocker'] = use_docker
+    config.use_docker = use_docker
 
     if use_docker:
         docker_image = questionary.text(
             "Docker image name:",
             default="myapp:latest",
-            validate=lambda text: len(text) > 0 or "Docker image name required"
+            validate=validate_docker_image
         ).ask()
 
-        config['dockerImage'] = docker_image
+        config.docker_image = docker_image
 
         registry = questionary.select(
             "Container registry:",
@@ -150,7 +319,7 @@ def deployment_wizard():
             ]
         ).ask()
 
-        config['registry'] = registry
+        config.registry = registry
 
     # Platform
     platform = questionary.select(
@@ -161,47 +330,50 @@ def deployment_wizard():
         ]
     ).ask()
 
-    config['platform'] = platform
+    config.platform = platform
 
     # Platform-specific configuration
     if platform == 'AWS':
         aws_service = questionary.select(
             "AWS service:",
-            choices=['ECS', 'EKS', 'Lambda', 'Elastic Beanstalk', 'EC2']
+            choices=AWS_SERVICES
         ).ask()
-        config['awsService'] = aws_service
+        config.aws_service = aws_service
 
         # Auto-scaling (only for certain services)
-        if aws_service in ['ECS', 'EKS']:
+        if aws_service in AUTO_SCALING_SERVICES:
             auto_scale = questionary.confirm(
                 "Enable auto-scaling?",
                 default=True
             ).ask()
 
-            config['autoScale'] = auto_scale
+            config.auto_scale = auto_scale
 
             if auto_scale:
                 min_instances = questionary.text(
                     "Minimum instances:",
                     default="1",
-                    validate=lambda text: text.isdigit() and int(text) > 0 or "Must be at least 1"
+                    validate=validate_min_instances
                 ).ask()
 
+                # Parse the minimum and build the message once, not per keystroke
+                min_count = int(min_instances)
+                min_error = f"Must be at least {min_instances}"
                 max_instances = questionary.text(
                     "Maximum instances:",
                     default="10",
-                    validate=lambda text: text.isdigit() and int(text) >= int(min_instances) or f"Must be at least {min_instances}"
+                    validate=lambda text: parse_bounded_int(text, min_count) is not None or min_error
                 ).ask()
 
-                config['minInstances'] = int(min_instances)
-                config['maxInstances'] = int(max_instances)
+                config.min_instances = min_count
+                config.max_instances = int(max_instances)
 
     elif platform == 'Google Cloud':
         gcp_service = questionary.select(
             "Google Cloud service:",
-            choices=['Cloud Run', 'GKE', 'App Engine', 'Compute Engine']
+            choices=GCP_SERVICES
         ).ask()
-        config['gcpService'] = gcp_service
+        config.gcp_service = gcp_service
 
     # CDN (only for production)
     if environment == 'Production':
@@ -210,14 +382,14 @@ def deployment_wizard():
             default=True
         ).ask()
 
-        config['useCDN'] = use_cdn
+        config.use_cdn = use_cdn
 
         if use_cdn:
             cdn_provider = questionary.select(
                 "CDN provider:",
-                choices=['CloudFlare', 'AWS CloudFront', 'Google Cloud CDN', 'Azure CDN']
+                choices=CDN_PROVIDERS
             ).ask()
-            config['cdnProvider'] = cdn_provider
+            config.cdn_provider = cdn_provider
 
     # Monitoring
     setup_monitoring = questionary.confirm(
@@ -229,16 +401,16 @@ def deployment_wizard():
         monitoring_tools = questionary.checkbox(
             "Select monitoring tools:",
             choices=['Prometheus', 'Grafana', 'Datadog', 'New Relic', 'Sentry'],
-            validate=lambda choices: len(choices) > 0 or "Select at least one tool"
+            validate=validate_monitoring_tools
         ).ask()
 
-        config['monitoringTools'] = monitoring_tools
+        config.monitoring_tools = monitoring_tools
 
     print("\n✅ Deployment configuration complete!")
-    import json
-    print(json.dumps(config, indent=2))
+    answers = config.to_dict()
+    print_json(answers)
 
-    return config
+    return answers
 
 
 def feature_flag_wizard():
@@ -249,7 +421,7 @@ def feature_flag_wizard():
     # Feature name
     feature_name = questionary.text(
         "Feature name:",
-        validate=lambda text: text and text.replace('-', '').replace('_', '').islower() or "Use lowercase, hyphens, underscores only"
+        validate=validate_feature_name
     ).ask()
 
     # Enabled by default
@@ -266,13 +438,7 @@ def feature_flag_wizard():
     # Rollout strategy
     rollout_strategy = questionary.select(
         "Rollout strategy:",
-        choices=[
-            'All users',
-            'Percentage rollout',
-            'User targeting',
-            'Beta users only',
-            'Manual control'
-        ]
+        choices=cached_choices(ROLLOUT_STRATEGIES)
     ).ask()
 
     config['rolloutStrategy'] = rollout_strategy
@@ -282,7 +448,7 @@ def feature_flag_wizard():
         rollout_percentage = questionary.text(
             "Rollout percentage (0-100):",
             default="10",
-            validate=lambda text: text.isdigit() and 0 <= int(text) <= 100 or "Must be between 0 and 100"
+            validate=validate_percentage
         ).ask()
 
         config['rolloutPercentage'] = int(rollout_percentage)
@@ -291,14 +457,8 @@ def feature_flag_wizard():
     if rollout_strategy == 'User targeting':
         target_user_groups = questionary.checkbox(
             "Target user groups:",
-            choices=[
-                'Beta testers',
-                'Premium users',
-                'Internal team',
-                'Early adopters',
-                'Specific regions'
-            ],
-            validate=lambda choices: len(choices) > 0 or "Select at least one group"
+            choices=cached_choices(USER_GROUPS),
+            validate=validate_user_groups
         ).ask()
 
         config['targetUserGroups'] = target_user_groups
@@ -307,13 +467,7 @@ def feature_flag_wizard():
         if 'Specific regions' in target_user_groups:
             target_regions = questionary.checkbox(
                 "Target regions:",
-                choices=[
-                    'North America',
-                    'Europe',
-                    'Asia Pacific',
-                    'South America',
-                    'Africa'
-                ]
+                choices=cached_choices(TARGET_REGIONS)
             ).ask()
 
             config['targetRegions'] = target_regions
@@ -327,13 +481,7 @@ def feature_flag_wizard():
     if enable_metrics:
         metrics = questionary.checkbox(
             "Select metrics to track:",
-            choices=[
-                'Usage count',
-                'User adoption rate',
-                'Performance impact',
-                'Error rate',
-                'User feedback'
-            ]
+            choices=cached_choices(FEATURE_METRICS)
         ).ask()
 
         config['metrics'] = metrics
@@ -347,14 +495,13 @@ def feature_flag_wizard():
     if add_expiration_date:
         expiration_date = questionary.text(
             "Expiration date (YYYY-MM-DD):",
-            validate=lambda text: len(text) == 10 and text.count('-') == 2 or "Use format YYYY-MM-DD"
+            validate=validate_expiration_date
         ).ask()
 
         config['expirationDate'] = expiration_date
 
     print("\n✅ Feature flag configured!")
-    import json
-    print(json.dumps(config, indent=2))
+    print_json(config)
 
     return config
 
@@ -367,78 +514,67 @@ def cicd_pipeline_wizard():
     # Provider
     provider = questionary.select(
         "CI/CD provider:",
-        choices=['GitHub Actions', 'GitLab CI', 'CircleCI', 'Jenkins', 'Travis CI']
+        choices=cached_choices(CI_PROVIDERS)
     ).ask()
 
-    config = {'provider': provider}
+    config = PipelineConfig(provider=provider)
 
     # Triggers
     triggers = questionary.checkbox(
         "Pipeline triggers:",
-        choices=[
-            'Push to main/master',
-            'Pull request',
-            'Tag creation',
-            'Manual trigger',
-            'Scheduled (cron)'
-        ],
+        choices=cached_choices(PIPELINE_TRIGGERS),
         default=['Push to main/master', 'Pull request']
     ).ask()
 
-    config['triggers'] = triggers
+    config.triggers = triggers
 
     # Cron schedule
     if 'Scheduled (cron)' in triggers:
         cron_schedule = questionary.text(
             "Cron schedule:",
             default="0 2 * * *",
-            validate=lambda text: len(text.split()) == 5 or "Invalid cron format (5 parts required)"
+            validate=validate_cron
         ).ask()
 
-        config['cronSchedule'] = cron_schedule
+        config.cron_schedule = cron_schedule
 
     # Stages
     stages = questionary.checkbox(
         "Pipeline stages:",
-        choices=['Build', 'Test', 'Lint', 'Security scan', 'Deploy'],
+        choices=cached_choices(PIPELINE_STAGES),
         default=['Build', 'Test', 'Deploy'],
-        validate=lambda choices: len(choices) > 0 or "Select at least one stage"
+        validate=validate_stages
     ).ask()
 
-    config['stages'] = stages
+    config.stages = stages
 
     # Test types
     if 'Test' in stages:
         test_types = questionary.checkbox(
             "Test types to run:",
-            choices=[
-                'Unit tests',
-                'Integration tests',
-                'E2E tests',
-                'Performance tests'
-            ]
+            choices=cached_choices(TEST_TYPES)
         ).ask()
 
-        config['testTypes'] = test_types
+        config.test_types = test_types
 
     # Security tools
     if 'Security scan' in stages:
         security_tools = questionary.checkbox(
             "Security scanning tools:",
-            choices=['Snyk', 'Dependabot', 'SonarQube', 'OWASP Dependency Check']
+            choices=cached_choices(SECURITY_TOOLS)
         ).ask()
 
-        config['securityTools'] = security_tools
+        config.security_tools = security_tools
 
     # Deploy environments
     if 'Deploy' in stages:
         deploy_environments = questionary.checkbox(
             "Deployment environments:",
-            choices=['Development', 'Staging', 'Production'],
+            choices=cached_choices(DEPLOY_ENVIRONMENTS),
             default=['Staging', 'Production']
         ).ask()
 
-        config['deployEnvironments'] = deploy_environments
+        config.deploy_environments = deploy_environments
 
         # Approval for production
         if 'Production' in deploy_environments:
@@ -447,7 +583,7 @@ def cicd_pipeline_wizard():
                 default=True
             ).ask()
 
-            config['requireApproval'] = require_approval
+            config.require_approval = require_approval
 
     # Notifications
     enable_notifications = questionary.confirm(
@@ -458,16 +594,16 @@ def cicd_pipeline_wizard():
     if enable_notifications:
         notification_channels = questionary.checkbox(
             "Notification channels:",
-            choices=['Email', 'Slack', 'Discord', 'Microsoft Teams']
+            choices=cached_choices(NOTIFICATION_CHANNELS)
         ).ask()
 
-        config['notificationChannels'] = notification_channels
+        config.notification_channels = notification_channels
 
     print("\n✅ CI/CD pipeline configured!")
-    import json
-    print(json.dumps(config, indent=2))
+    answers = config.to_dict()
+    print_json(answers)
 
-    return config
+    return answers
 
 
 def main():
@@ -27,13 +27,17 @@ def process(
     if verbose:
         typer.echo(f"Processing: {input_file}")
 
-    content = input_file.read_text()
+    content = input_file.read_bytes()
 
     if uppercase:
-        content = content.upper()
+        # bytes.upper() is a plain ASCII loop; only non-ASCII text needs decoding
+        if content.isascii():
+            content = content.upper()
+        else:
+            content = content.decode().upper().encode()
 
     if output:
-        output.write_text(content)
+        output.write_bytes(content)
         typer.secho(f"✓ Written to: {output}", fg=typer.colors.GREEN)
     else:
         typer.echo(content)
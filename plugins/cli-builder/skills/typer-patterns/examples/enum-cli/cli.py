@@ -4,7 +4,7 @@ This example demonstrates:
 - Enum usage for constrained choices
 - Multiple enum types
 - Autocomplete with enums
-- Match/case with enum values
+- Dispatch tables keyed by enum values
 """
 
 import typer
@@ -30,6 +30,23 @@ class OutputFormat(str, Enum):
     text = "text"
 
 
+# Formatter per output format, looked up with one dict access
+FORMATTERS = {
+    OutputFormat.json: lambda data: json.dumps(data, indent=2),
+    # Simplified YAML output
+    OutputFormat.yaml: lambda data: "\n".join(f"{k}: {v}" for k, v in data.items()),
+    OutputFormat.text: lambda data: "\n".join(
+        f"{k.upper()}: {v}" for k, v in data.items()
+    ),
+}
+
+SEVERITY_MESSAGES = {
+    LogLevel.debug: "Severity: Lowest - detailed debugging information",
+    LogLevel.info: "Severity: Low - informational messages",
+    LogLevel.warning: "Severity: Medium - warning messages",
+    LogLevel.error: "Severity: High - error messages",
+}
+
 app = typer.Typer(help="Configuration export CLI with Enums")
 
 
@@ -59,16 +76,7 @@ def export(
     }
 
     # Format output based on enum
-    match format:
-        case OutputFormat.json:
-            output_text = json.dumps(data, indent=2)
-        case OutputFormat.yaml:
-            # Simplified YAML output
-            output_text = "\n".join(f"{k}: {v}" for k, v in data.items())
-        case OutputFormat.text:
-            output_text = "\n".join(
-                f"{k.upper()}: {v}" for k, v in data.items()
-            )
+    output_text = FORMATTERS[format](data)
 
     # Output
     if output:
@@ -87,15 +95,7 @@ def validate(
     typer.echo(f"Log Level: {level.value}")
 
     # Access enum properties
-    match level:
-        case LogLevel.debug:
-            typer.echo("Severity: Lowest - detailed debugging information")
-        case LogLevel.info:
-            typer.echo("Severity: Low - informational messages")
-        case LogLevel.warning:
-            typer.echo("Severity: Medium - warning messages")
-        case LogLevel.error:
-            typer.echo("Severity: High - error messages")
+    typer.echo(SEVERITY_MESSAGES[level])
 
 
 if __name__ == "__main__":
@@ -5,15 +5,27 @@ This example demonstrates:
 - Dependency injection
 - Testable CLI structure
 - Configuration injection
+- Shared prototype app copied per instance
 """
 
-import typer
-from typing import Protocol, Optional
+import copy
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Iterable, Protocol, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+# typer (and click/rich behind it) is imported inside the app factories, so the
+# config and storage classes can be used without paying for it
+if TYPE_CHECKING:
+    import typer
 
-@dataclass
+
+# Large enough that a typical value is written with a single syscall
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+@dataclass(slots=True)
 class Config:
     """Application configuration."""
 
@@ -48,6 +60,10 @@ class MemoryStorage:
         """Load from memory."""
         return self.data.get(key, "")
 
+    def save_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        """Save several pairs to memory."""
+        self.data.update(items)
+
 
 class FileStorage:
     """File-based storage implementation."""
@@ -55,36 +71,63 @@ class FileStorage:
     def __init__(self, base_dir: Path) -> None:
         self.base_dir = base_dir
         self.base_dir.mkdir(exist_ok=True)
+        self._base_str = str(base_dir)
+        self._paths: dict[str, str] = {}
+
+    def _path(self, key: str) -> str:
+        """Return the file path for a key, built once with plain strings."""
+        path = self._paths.get(key)
+        if path is None:
+            path = self._paths[key] = os.path.join(self._base_str, key + ".txt")
+        return path
 
     def save(self, key: str, value: str) -> None:
         """Save to file."""
-        file_path = self.base_dir / f"{key}.txt"
-        file_path.write_text(value)
+        with open(self._path(key), "w", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(value)
+
+    def save_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        """Save several pairs to files in one pass.
+
+        Each value goes out through one buffered write. This is an extra on
+        the concrete storages, not part of the Storage protocol.
+        """
+        path_for = self._path
+        for key, value in items:
+            with open(path_for(key), "w", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(value)
 
     def load(self, key: str) -> str:
         """Load from file."""
-        file_path = self.base_dir / f"{key}.txt"
-        return file_path.read_text() if file_path.exists() else ""
+        try:
+            with open(self._path(key)) as f:
+                return f.read()
+        except FileNotFoundError:
+            return ""
 
 
-def create_app(config: Optional[Config] = None, storage: Optional[Storage] = None) -> typer.Typer:
-    """Factory function to create Typer app with dependencies.
+@dataclass(slots=True)
+class AppState:
+    """Per-app bindings handed to the shared commands through ctx.obj."""
 
-    This pattern enables:
-    - Dependency injection for testing
-    - Configuration flexibility
-    - Multiple app instances
-    - Easier unit testing
+    config: Config
+    save_value: Callable[[str, str], None]
+    load_value: Callable[[str], str]
 
-    Args:
-        config: Application configuration
-        storage: Storage implementation
 
-    Returns:
-        Configured Typer application
+@lru_cache(maxsize=None)
+def build_prototype() -> "typer.Typer":
+    """Build the command set once; create_app() hands out copies of it.
+
+    Commands take their config and storage from ctx.obj, so the same
+    registered commands serve every app instance.
     """
-    config = config or Config()
-    storage = storage or FileStorage(config.data_dir)
+    import typer
+
+    # Status marks styled once instead of on every secho() call
+    ok_mark = typer.style("✓ ", fg=typer.colors.GREEN)
+    error_mark = typer.style("✗ ", fg=typer.colors.RED)
+    missing_mark = typer.style("✗ ", fg=typer.colors.YELLOW)
 
     app = typer.Typer(
         help="Data management CLI with factory pattern",
@@ -93,39 +136,45 @@ def create_app(config: Optional[Config] = None, storage: Optional[Storage] = Non
 
     @app.command()
     def save(
+        ctx: typer.Context,
         key: str = typer.Argument(..., help="Data key"),
         value: str = typer.Argument(..., help="Data value"),
     ) -> None:
         """Save data using injected storage."""
-        if config.verbose:
+        state = ctx.obj
+        if state.config.verbose:
             typer.echo(f"Saving {key}={value}")
 
         try:
-            storage.save(key, value)
-            typer.secho(f"✓ Saved {key}", fg=typer.colors.GREEN)
+            state.save_value(key, value)
+            typer.echo(f"{ok_mark}Saved {key}")
         except Exception as e:
-            typer.secho(f"✗ Error: {e}", fg=typer.colors.RED, err=True)
+            typer.echo(f"{error_mark}Error: {e}", err=True)
             raise typer.Exit(1)
 
     @app.command()
-    def load(key: str = typer.Argument(..., help="Data key")) -> None:
+    def load(
+        ctx: typer.Context, key: str = typer.Argument(..., help="Data key")
+    ) -> None:
         """Load data using injected storage."""
-        if config.verbose:
+        state = ctx.obj
+        if state.config.verbose:
             typer.echo(f"Loading {key}")
 
         try:
-            value = storage.load(key)
+            value = state.load_value(key)
             if value:
                 typer.echo(value)
             else:
-                typer.secho(f"✗ Key not found: {key}", fg=typer.colors.YELLOW)
+                typer.echo(f"{missing_mark}Key not found: {key}")
         except Exception as e:
-            typer.secho(f"✗ Error: {e}", fg=typer.colors.RED, err=True)
+            typer.echo(f"{error_mark}Error: {e}", err=True)
             raise typer.Exit(1)
 
     @app.command()
-    def config_show() -> None:
+    def config_show(ctx: typer.Context) -> None:
         """Show current configuration."""
+        config = ctx.obj.config
         typer.echo("Configuration:")
         typer.echo(f"  Verbose: {config.verbose}")
         typer.echo(f"  Data dir: {config.data_dir}")
@@ -134,21 +183,58 @@ def create_app(config: Optional[Config] = None, storage: Optional[Storage] = Non
     return app
 
 
+def create_app(config: Optional[Config] = None, storage: Optional[Storage] = None) -> "typer.Typer":
+    """Factory function to create Typer app with dependencies.
+
+    This pattern enables:
+    - Dependency injection for testing
+    - Configuration flexibility
+    - Multiple app instances
+    - Easier unit testing
+
+    Args:
+        config: Application configuration
+        storage: Storage implementation
+
+    Returns:
+        Configured Typer application
+    """
+    config = config or Config()
+    storage = storage or FileStorage(config.data_dir)
+    # Bind the storage methods once; commands call them without a lookup
+    state = AppState(config=config, save_value=storage.save, load_value=storage.load)
+
+    # Copy the prototype instead of re-registering every command; the lists
+    # and info are copied so commands, sub-apps and settings added to this app
+    # do not leak into other apps
+    app = copy.copy(build_prototype())
+    app.registered_commands = list(app.registered_commands)
+    app.registered_groups = list(app.registered_groups)
+    app.info = copy.copy(app.info)
+    # The state rides in as the root context's obj rather than being set by a
+    # callback, so callers remain free to add their own @app.callback()
+    app.info.context_settings = {**(app.info.context_settings or {}), "obj": state}
+
+    return app
+
+
 def main() -> None:
     """Main entry point with configuration."""
     import sys
 
-    # Parse global flags
-    verbose = "--verbose" in sys.argv or "-v" in sys.argv
+    # Parse global flags in one pass, keeping everything else for typer
+    verbose = False
     data_dir = Path("./data")
-
-    # Check for custom data directory
-    if "--data-dir" in sys.argv:
-        idx = sys.argv.index("--data-dir")
-        if idx + 1 < len(sys.argv):
-            data_dir = Path(sys.argv[idx + 1])
-            sys.argv.pop(idx)  # Remove flag
-            sys.argv.pop(idx)  # Remove value
+    remaining = [sys.argv[0]]
+    args = iter(sys.argv[1:])
+    for arg in args:
+        if arg in ("-v", "--verbose"):
+            verbose = True
+        elif arg == "--data-dir":
+            data_dir = Path(next(args, "./data"))
+        else:
+            remaining.append(arg)
+    sys.argv[:] = remaining
 
     # Create configuration
     config = Config(verbose=verbose, data_dir=data_dir)
@@ -7,17 +7,47 @@ This template demonstrates:
 - Clean separation of concerns
 """
 
+import os
+
 import typer
+from dataclasses import dataclass
 from typing import Optional
 from pathlib import Path
 
+
+@dataclass(slots=True)
+class GlobalContext:
+    """Global options shared with sub-commands through ctx.obj."""
+
+    config: Optional[Path] = None
+    verbose: bool = False
+
+
 # Main application
 app = typer.Typer(
     name="mycli",
     help="Example CLI with sub-applications",
-    add_completion=True,
+    # Completion lives in the `completion` command below instead of hidden
+    # --install-completion/--show-completion options built on every run
+    add_completion=False,
 )
 
+# The installed completion script re-runs the CLI with _<PROG>_COMPLETE set;
+# Typer's shell classes must be registered before click answers that request
+if any(k.startswith("_") and k.endswith("_COMPLETE") for k in os.environ):
+    from typer.completion import completion_init
+
+    completion_init()
+
+# Status lines styled once at import; commands print them with plain echo()
+MIGRATED = typer.style("✓ Migrations complete", fg=typer.colors.GREEN)
+SEEDED = typer.style("✓ Database seeded", fg=typer.colors.GREEN)
+BACKED_UP = typer.style("✓ Backup complete", fg=typer.colors.GREEN)
+STARTED = typer.style("✓ Server started", fg=typer.colors.GREEN)
+STOPPED = typer.style("✓ Server stopped", fg=typer.colors.GREEN)
+CREATED_MARK = typer.style("✓ ", fg=typer.colors.GREEN)
+DELETED_MARK = typer.style("✓ ", fg=typer.colors.RED)
+
 # Database sub-app
 db_app = typer.Typer(help="Database management commands")
 app.add_typer(db_app, name="db")
@@ -42,12 +72,28 @@ def main(
 ) -> None:
     """Global options for all commands."""
     # Store in context for sub-commands
-    ctx.obj = {"config": config, "verbose": verbose}
+    ctx.obj = GlobalContext(config=config, verbose=verbose)
 
     if verbose:
         typer.echo(f"Config: {config or 'default'}")
 
 
+@app.command()
+def completion(
+    ctx: typer.Context,
+    install: bool = typer.Option(
+        False, "--install", help="Install completion for the current shell"
+    ),
+) -> None:
+    """Show or install shell completion."""
+    # Typer's completion support is only imported when this command runs
+    from typer.completion import completion_init, install_callback, show_callback
+
+    completion_init()
+    callback = install_callback if install else show_callback
+    callback(ctx, None, True)
+
+
 # Database commands
 @db_app.command("migrate")
 def db_migrate(
@@ -56,12 +102,12 @@ def db_migrate(
     steps: int = typer.Option(1, help="Number of migration steps"),
 ) -> None:
     """Run database migrations."""
-    verbose = ctx.obj.get("verbose", False)
+    verbose = ctx.obj.verbose
 
     if verbose:
         typer.echo(f"Running {steps} migration(s) {direction}")
 
-    typer.secho("✓ Migrations complete", fg=typer.colors.GREEN)
+    typer.echo(MIGRATED)
 
 
 @db_app.command("seed")
@@ -69,19 +115,19 @@ def db_seed(
     ctx: typer.Context, file: Optional[Path] = typer.Option(None, "--file", "-f")
 ) -> None:
     """Seed database with test data."""
-    verbose = ctx.obj.get("verbose", False)
+    verbose = ctx.obj.verbose
 
     if verbose:
         typer.echo(f"Seeding from: {file or 'default seed'}")
 
-    typer.secho("✓ Database seeded", fg=typer.colors.GREEN)
+    typer.echo(SEEDED)
 
 
 @db_app.command("backup")
 def db_backup(ctx: typer.Context, output: Path = typer.Argument(...)) -> None:
     """Backup database to file."""
     typer.echo(f"Backing up database to {output}")
-    typer.secho("✓ Backup complete", fg=typer.colors.GREEN)
+    typer.echo(BACKED_UP)
 
 
 # Server commands
@@ -93,7 +139,7 @@ def server_start(
     reload: bool = typer.Option(False, "--reload", help="Enable auto-reload"),
 ) -> None:
     """Start the application server."""
-    verbose = ctx.obj.get("verbose", False)
+    verbose = ctx.obj.verbose
 
     if verbose:
         typer.echo(f"Starting server on {host}:{port}")
@@ -101,14 +147,14 @@ def server_start(
     if reload:
         typer.echo("Auto-reload enabled")
 
-    typer.secho("✓ Server started", fg=typer.colors.GREEN)
+    typer.echo(STARTED)
 
 
 @server_app.command("stop")
 def server_stop(ctx: typer.Context) -> None:
     """Stop the application server."""
     typer.echo("Stopping server...")
-    typer.secho("✓ Server stopped", fg=typer.colors.GREEN)
+    typer.echo(STOPPED)
 
 
 @server_app.command("status")
@@ -126,7 +172,7 @@ def user_create(
     admin: bool = typer.Option(False, "--admin", help="Create as admin"),
 ) -> None:
     """Create a new user."""
-    verbose = ctx.obj.get("verbose", False)
+    verbose = ctx.obj.verbose
 
     if verbose:
         typer.echo(f"Creating user: {username} ({email})")
@@ -134,7 +180,7 @@ def user_create(
     if admin:
         typer.echo("Creating with admin privileges")
 
-    typer.secho(f"✓ User {username} created", fg=typer.colors.GREEN)
+    typer.echo(f"{CREATED_MARK}User {username} created")
 
 
 @user_app.command("delete")
@@ -150,7 +196,7 @@ def user_delete(
             typer.echo("Cancelled")
             raise typer.Abort()
 
-    typer.secho(f"✓ User {username} deleted", fg=typer.colors.RED)
+    typer.echo(f"{DELETED_MARK}User {username} deleted")
 
 
 @user_app.command("list")